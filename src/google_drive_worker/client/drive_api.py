@@ -5,8 +5,11 @@ It handles authentication, rate limiting, and error classification according to
 the integration architecture patterns.
 """
 
+import json
 import logging
-from typing import Dict, Any, Optional, List
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Dict, Any, Optional, List, Union
 from urllib.parse import urlencode
 
 import httpx
@@ -28,6 +31,9 @@ from ..utils.errors import (
 
 logger = logging.getLogger(__name__)
 
+# Request body types accepted by _make_request(content=...)
+RequestContent = Union[bytes, AsyncIterable[bytes]]
+
 
 class GoogleDriveAPIClient:
     """Async client for Google Drive API v3.
@@ -41,9 +47,14 @@ class GoogleDriveAPIClient:
     """
 
     BASE_URL = "https://www.googleapis.com/drive/v3"
+    UPLOAD_URL = "https://www.googleapis.com/upload/drive/v3/files"
     DEFAULT_TIMEOUT = 30.0
     MAX_RETRIES = 3
 
+    # Uploads larger than this use the resumable protocol
+    RESUMABLE_THRESHOLD = 5 * 1024 * 1024
+    UPLOAD_FIELDS = "id,name,mimeType,parents,size"
+
     def __init__(
         self,
         access_token: str,
@@ -292,6 +303,291 @@ class GoogleDriveAPIClient:
 
         return response
 
+    async def create_folder(
+        self,
+        name: str,
+        parent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Create a new folder.
+
+        Args:
+            name: Folder name
+            parent_id: Optional parent folder ID (defaults to My Drive root)
+
+        Returns:
+            Created folder metadata (id, name, mimeType, parents)
+
+        Raises:
+            RateLimitError: If API rate limit exceeded
+            RetriableError: For temporary failures
+            TerminalError: For permanent failures
+        """
+        logger.info(
+            "Creating folder: name=%s, parent_id=%s",
+            name, parent_id,
+        )
+
+        body: Dict[str, Any] = {
+            "name": name,
+            "mimeType": "application/vnd.google-apps.folder",
+        }
+        if parent_id:
+            body["parents"] = [parent_id]
+
+        params = {
+            "supportsAllDrives": True,
+            "fields": "id,name,mimeType,parents",
+        }
+
+        url = f"{self.BASE_URL}/files"
+        response = await self._make_request("POST", url, params=params, json_data=body)
+
+        logger.info(
+            "Successfully created folder: folder_id=%s",
+            response.get("id"),
+        )
+
+        return response
+
+    async def copy_file(
+        self,
+        file_id: str,
+        name: Optional[str] = None,
+        parent_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Copy a file. Folders cannot be copied directly by the Drive API.
+
+        Args:
+            file_id: The ID of the file to copy
+            name: Optional name for the copy (defaults to the source name)
+            parent_id: Optional destination folder ID
+
+        Returns:
+            Copied file metadata (id, name, mimeType, parents)
+
+        Raises:
+            RateLimitError: If API rate limit exceeded
+            RetriableError: For temporary failures
+            TerminalError: For permanent failures
+        """
+        logger.info(
+            "Copying file: file_id=%s, parent_id=%s",
+            file_id, parent_id,
+        )
+
+        body: Dict[str, Any] = {}
+        if name:
+            body["name"] = name
+        if parent_id:
+            body["parents"] = [parent_id]
+
+        params = {
+            "supportsAllDrives": True,
+            "fields": "id,name,mimeType,parents",
+        }
+
+        url = f"{self.BASE_URL}/files/{file_id}/copy"
+        response = await self._make_request("POST", url, params=params, json_data=body)
+
+        logger.info(
+            "Successfully copied file: file_id=%s, copy_id=%s",
+            file_id,
+            response.get("id"),
+        )
+
+        return response
+
+    async def update_file_metadata(
+        self,
+        file_id: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        add_parents: Optional[List[str]] = None,
+        remove_parents: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """Update file metadata and/or move the file between folders.
+
+        Args:
+            file_id: The ID of the file to update
+            metadata: Metadata fields to patch (e.g. name, description)
+            add_parents: Folder IDs to add as parents
+            remove_parents: Folder IDs to remove as parents
+
+        Returns:
+            Updated file metadata (id, name, mimeType, parents)
+
+        Raises:
+            RateLimitError: If API rate limit exceeded
+            RetriableError: For temporary failures
+            TerminalError: For permanent failures
+        """
+        logger.info(
+            "Updating file metadata: file_id=%s, add_parents=%s, remove_parents=%s",
+            file_id, add_parents, remove_parents,
+        )
+
+        params: Dict[str, Any] = {
+            "supportsAllDrives": True,
+            "fields": "id,name,mimeType,parents",
+        }
+        if add_parents:
+            params["addParents"] = ",".join(add_parents)
+        if remove_parents:
+            params["removeParents"] = ",".join(remove_parents)
+
+        url = f"{self.BASE_URL}/files/{file_id}"
+        response = await self._make_request(
+            "PATCH", url, params=params, json_data=metadata or {}
+        )
+
+        logger.info(
+            "Successfully updated file metadata: file_id=%s",
+            file_id,
+        )
+
+        return response
+
+    async def upload_file(
+        self,
+        metadata: Dict[str, Any],
+        content: bytes,
+        mime_type: str,
+    ) -> Dict[str, Any]:
+        """Upload a new file.
+
+        Content up to RESUMABLE_THRESHOLD is sent as a single
+        multipart/related request. Larger content uses the resumable
+        protocol, sent in one request and resumed from the last committed
+        byte if it is interrupted.
+
+        Args:
+            metadata: File metadata (name, parents, description, ...)
+            content: File bytes
+            mime_type: MIME type of the content
+
+        Returns:
+            Created file metadata (id, name, mimeType, parents, size)
+
+        Raises:
+            RateLimitError: If API rate limit exceeded
+            RetriableError: For temporary failures
+            TerminalError: For permanent failures
+        """
+        logger.info(
+            "Uploading file: name=%s, mime_type=%s, size=%s",
+            metadata.get("name"),
+            mime_type,
+            len(content),
+        )
+
+        if len(content) <= self.RESUMABLE_THRESHOLD:
+            response = await self._upload_multipart(metadata, content, mime_type)
+        else:
+            response = await self._upload_resumable(metadata, content, mime_type)
+
+        logger.info(
+            "Successfully uploaded file: file_id=%s",
+            response.get("id"),
+        )
+
+        return response
+
+    async def _upload_multipart(
+        self,
+        metadata: Dict[str, Any],
+        content: bytes,
+        mime_type: str,
+    ) -> Dict[str, Any]:
+        """Upload small content with uploadType=multipart.
+
+        The multipart/related body is streamed from its parts rather than one
+        concatenated buffer, so the file content is never copied.
+        """
+        boundary = uuid.uuid4().hex
+        head = (
+            f"--{boundary}\r\n"
+            "Content-Type: application/json; charset=UTF-8\r\n\r\n"
+            f"{json.dumps(metadata)}\r\n"
+            f"--{boundary}\r\n"
+            f"Content-Type: {mime_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        return await self._make_request(
+            "POST",
+            self.UPLOAD_URL,
+            params={
+                "uploadType": "multipart",
+                "supportsAllDrives": True,
+                "fields": self.UPLOAD_FIELDS,
+            },
+            content=_ReplayableBody(head, content, tail),
+            extra_headers={
+                "Content-Type": f"multipart/related; boundary={boundary}",
+                "Content-Length": str(len(head) + len(content) + len(tail)),
+            },
+        )
+
+    async def _upload_resumable(
+        self,
+        metadata: Dict[str, Any],
+        content: bytes,
+        mime_type: str,
+    ) -> Dict[str, Any]:
+        """Upload content with uploadType=resumable in a single request.
+
+        If the request fails or Drive reports the upload incomplete, the
+        rest of the content is resent from the last byte Drive has
+        committed, so transient errors never restart the whole upload.
+        """
+        session = await self._make_request(
+            "POST",
+            self.UPLOAD_URL,
+            params={
+                "uploadType": "resumable",
+                "supportsAllDrives": True,
+                "fields": self.UPLOAD_FIELDS,
+            },
+            json_data=metadata,
+            extra_headers={"X-Upload-Content-Type": mime_type},
+            return_response=True,
+        )
+        session_url = session.headers.get("Location")
+        if not session_url:
+            raise RetriableError("Resumable upload session was not created")
+
+        total = len(content)
+        offset = 0
+        for attempt in range(self.MAX_RETRIES):
+            try:
+                response = await self._make_request(
+                    "PUT",
+                    session_url,
+                    content=content[offset:] if offset else content,
+                    extra_headers={"Content-Range": f"bytes {offset}-{total - 1}/{total}"},
+                    return_response=True,
+                )
+            except RetriableError:
+                if attempt == self.MAX_RETRIES - 1:
+                    raise
+                # Ask Drive how much it committed before resending
+                response = await self._make_request(
+                    "PUT",
+                    session_url,
+                    content=b"",
+                    extra_headers={"Content-Range": f"bytes */{total}"},
+                    return_response=True,
+                )
+
+            if response.status_code != 308:
+                return response.json()
+            # Resume Incomplete - continue from the last committed byte
+            offset = _committed_offset(response)
+
+        raise RetriableError(
+            "Resumable upload was not completed",
+            details={"committed_bytes": offset},
+        )
+
     async def list_changes(
         self,
         page_token: str,
@@ -601,6 +897,9 @@ class GoogleDriveAPIClient:
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
         parse_json: bool = True,
+        content: Optional[RequestContent] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+        return_response: bool = False,
     ) -> Any:
         """Make an HTTP request to the Google Drive API.
 
@@ -612,9 +911,14 @@ class GoogleDriveAPIClient:
             params: Query parameters
             json_data: JSON body for POST/PATCH requests
             parse_json: Whether to parse response as JSON
+            content: Raw request body (used by uploads instead of json_data)
+            extra_headers: Additional request headers
+            return_response: Return the httpx.Response itself, without raising
+                for non-error statuses such as 308 Resume Incomplete
 
         Returns:
-            Parsed JSON response or raw bytes if parse_json=False
+            Parsed JSON response, raw bytes if parse_json=False, or the
+            response object if return_response=True
 
         Raises:
             RateLimitError: If API rate limit exceeded
@@ -625,6 +929,8 @@ class GoogleDriveAPIClient:
             "Authorization": f"Bearer {self._access_token}",
             "Accept": "application/json" if parse_json else "*/*",
         }
+        if extra_headers:
+            headers.update(extra_headers)
 
         try:
             response = await self._http_client.request(
@@ -632,6 +938,7 @@ class GoogleDriveAPIClient:
                 url,
                 params=params,
                 json=json_data,
+                content=content,
                 headers=headers,
             )
 
@@ -668,6 +975,7 @@ class GoogleDriveAPIClient:
                             url,
                             params=params,
                             json=json_data,
+                            content=content,
                             headers=headers,
                         )
 
@@ -712,6 +1020,9 @@ class GoogleDriveAPIClient:
                     f"Client error: {response.status_code} - {error_detail.get('message', 'Unknown error')}"
                 )
 
+            if return_response:
+                return response
+
             # Success
             response.raise_for_status()
 
@@ -756,4 +1067,31 @@ class GoogleDriveAPIClient:
                 return error_json["error"]
             return error_json
         except Exception:
-            return {"message": response.text[:500] if response.text else "Unknown error"}
\ No newline at end of file
+            return {"message": response.text[:500] if response.text else "Unknown error"}
+
+
+class _ReplayableBody:
+    """Async request body streamed from byte parts.
+
+    Unlike an async generator, it can be iterated again, which the token
+    refresh retry in _make_request relies on.
+    """
+
+    def __init__(self, *parts: bytes) -> None:
+        self._parts = parts
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for part in self._parts:
+            yield part
+
+
+def _committed_offset(response: httpx.Response) -> int:
+    """Parse the committed byte count from a resumable upload Range header.
+
+    Drive returns ``Range: bytes=0-<last committed byte>``; no header means
+    nothing has been committed yet.
+    """
+    range_header = response.headers.get("Range")
+    if not range_header:
+        return 0
+    return int(range_header.rsplit("-", 1)[-1]) + 1
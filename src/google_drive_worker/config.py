@@ -27,6 +27,21 @@ class KafkaConfig(BaseSettings):
         default=False,
         description="Enable auto-commit (MUST be False for at-least-once delivery)",
     )
+    linger_ms: int = Field(
+        default=50,
+        description="How long the producer waits to fill a batch before sending",
+    )
+    batch_size: int = Field(
+        default=64 * 1024,
+        description="Maximum producer batch size in bytes per partition",
+    )
+    compression_type: Optional[Literal["gzip", "snappy", "lz4", "zstd"]] = Field(
+        default=None,
+        description=(
+            "Producer batch compression (snappy/lz4/zstd need the matching "
+            "codec package installed)"
+        ),
+    )
 
     model_config = SettingsConfigDict(env_prefix="KAFKA_")
 
@@ -55,6 +70,28 @@ class WorkerConfig(BaseSettings):
         default=10,
         description="Maximum concurrent connections to process",
     )
+    consumer_batch_size: int = Field(
+        default=100,
+        description=(
+            "Maximum messages per Kafka poll; larger polls spread per-poll "
+            "overhead over more messages, smaller ones finish (and commit) sooner"
+        ),
+    )
+    consumer_poll_timeout_ms: int = Field(
+        default=500,
+        description="How long a Kafka poll waits for messages, in milliseconds",
+    )
+    commit_interval_seconds: float = Field(
+        default=5.0,
+        description=(
+            "Minimum time between Kafka offset commits; 0 commits after every "
+            "batch. Larger values mean more redelivery after a crash"
+        ),
+    )
+    shutdown_grace_seconds: float = Field(
+        default=30.0,
+        description="Maximum time stop() waits for in-flight connections to finish",
+    )
     processing_timeout_seconds: int = Field(
         default=300,
         description="Timeout for processing a single trigger",
@@ -83,6 +120,14 @@ class WorkerConfig(BaseSettings):
         default=86400,  # 24 hours
         description="TTL for idempotency cache entries",
     )
+    connection_config_cache_size: int = Field(
+        default=1024,
+        description="Max Control Plane connection configs cached",
+    )
+    connection_config_cache_ttl_seconds: int = Field(
+        default=60,
+        description="TTL for cached connection configs (bounds credential staleness)",
+    )
 
 
 class GoogleDriveAPIConfig(BaseSettings):
@@ -154,6 +199,11 @@ class GoogleDriveAPIConfig(BaseSettings):
         default=10,
         description="Fetch last N revisions per file",
     )
+    # Normalization
+    transform_debug: bool = Field(
+        default=False,
+        description="Include the _metadata debug summary in normalized files",
+    )
     # Rate limiting
     quota_user_identifier: Optional[str] = Field(
         default=None,
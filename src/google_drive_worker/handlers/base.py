@@ -10,6 +10,7 @@ Inherits from toolkit's BaseActionHandler to get:
 
 from __future__ import annotations
 
+import logging
 from abc import abstractmethod
 from collections.abc import AsyncGenerator
 from typing import Any, Optional
@@ -19,6 +20,10 @@ from clustera_integration_toolkit.handlers import (
     BaseActionHandler as ToolkitBaseActionHandler,
 )
 
+# stdlib logger that structlog's LoggerFactory resolves for handler loggers
+# (they are bound in this module); used for cheap level checks
+_stdlib_logger = logging.getLogger(__name__)
+
 
 class BaseActionHandler(ToolkitBaseActionHandler):
     """Google Drive-specific base handler extending toolkit's BaseActionHandler.
@@ -49,10 +54,10 @@ class BaseActionHandler(ToolkitBaseActionHandler):
     }
 
     # Override in subclass to specify which action(s) this handler processes
-    SUPPORTED_ACTIONS: set[str] = set()
+    SUPPORTED_ACTIONS: frozenset[str] = frozenset()
 
     # Override in subclass to specify which JSON-RPC method(s) this handler processes
-    SUPPORTED_METHODS: set[str] = set()
+    SUPPORTED_METHODS: frozenset[str] = frozenset()
 
     def __init__(self, api_config: Any = None) -> None:
         """Initialize handler.
@@ -120,6 +125,20 @@ class BaseActionHandler(ToolkitBaseActionHandler):
         """
         ...
 
+    def is_log_enabled(self, level: int) -> bool:
+        """Check whether self.logger would emit at the given stdlib level.
+
+        Lets hot paths skip building log kwargs that structlog's
+        filter_by_level would discard anyway.
+
+        Args:
+            level: stdlib logging level (e.g. logging.INFO)
+
+        Returns:
+            True if records at this level are emitted
+        """
+        return _stdlib_logger.isEnabledFor(level)
+
     def generate_idempotency_key(
         self,
         connection_id: str,
@@ -177,9 +196,31 @@ class BaseActionHandler(ToolkitBaseActionHandler):
         Returns:
             Header parameters dict
         """
-        params = self.extract_params(message)
-        header = params.get("header", {})
-        return header.get("parameters", {})
+        return self.extract_envelope(message)[1]
+
+    def extract_envelope(
+        self, message: dict[str, Any], is_jsonrpc: bool | None = None
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Extract params and header parameters in a single pass.
+
+        Equivalent to calling extract_params() and extract_header_params(),
+        without walking the envelope (and checking the format) twice.
+
+        Args:
+            message: The incoming message dict
+            is_jsonrpc: Precomputed is_jsonrpc_request(message), if known
+
+        Returns:
+            Tuple of (params, header parameters)
+        """
+        if is_jsonrpc is None:
+            is_jsonrpc = self.is_jsonrpc_request(message)
+        if is_jsonrpc:
+            params = message.get("params", {})
+        else:
+            params = message
+        header_params = params.get("header", {}).get("parameters", {})
+        return params, header_params
 
     # NOTE: fetch_connection_config() is inherited from ToolkitBaseActionHandler
     # It fetches OAuth credentials from Control Plane using M2M authentication.
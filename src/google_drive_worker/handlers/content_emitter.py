@@ -112,7 +112,9 @@ class ContentIngestEmitter:
         self.logger = logger or structlog.get_logger().bind(
             component="ContentIngestEmitter"
         )
-        self.transformer = GoogleDriveDataTransformer()
+        self.transformer = GoogleDriveDataTransformer(
+            include_debug_metadata=api_config.transform_debug
+        )
         self._storage_client: FileStorageClient | None = None
 
     @property
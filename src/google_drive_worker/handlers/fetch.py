@@ -70,12 +70,12 @@ class FetchHandler(BaseActionHandler):
     """
 
     # JSON-RPC 2.0 method routing
-    SUPPORTED_METHODS = {"clustera.integration.content.fetch"}
+    SUPPORTED_METHODS = frozenset({"clustera.integration.content.fetch"})
 
     # Legacy action routing (backward compatibility)
-    SUPPORTED_ACTIONS = {"fetch"}
+    SUPPORTED_ACTIONS = frozenset({"fetch"})
 
-    SUPPORTED_RESOURCE_TYPES: set[FetchResourceType] = {
+    SUPPORTED_RESOURCE_TYPES: frozenset[FetchResourceType] = frozenset({
         "files",
         "file",
         "folders",
@@ -86,7 +86,9 @@ class FetchHandler(BaseActionHandler):
         "revision",
         "changes",
         "about",
-    }
+    })
+    # Deterministic listing for validation error details
+    _SUPPORTED_RESOURCE_TYPES_SORTED: tuple[str, ...] = tuple(sorted(SUPPORTED_RESOURCE_TYPES))
 
     DEFAULT_LIMIT: int = 100
     MAX_LIMIT: int = 1000
@@ -103,7 +105,9 @@ class FetchHandler(BaseActionHandler):
             storage_config: Storage configuration (for file uploads)
         """
         super().__init__(api_config)
-        self.transformer = GoogleDriveDataTransformer()
+        self.transformer = GoogleDriveDataTransformer(
+            include_debug_metadata=api_config.transform_debug
+        )
         self.storage_config = storage_config or StorageConfig()
         # Use ContentIngestEmitter for building content.ingest messages
         self._content_emitter: ContentIngestEmitter | None = None
@@ -211,11 +215,12 @@ class FetchHandler(BaseActionHandler):
         Yields:
             Response envelope with fetched resources and pagination
         """
-        self._validate_message(message)
+        # Format check done once and shared with validation
+        is_jsonrpc = self.is_jsonrpc_request(message)
+        self._validate_message(message, is_jsonrpc)
 
         # Extract params - handles both JSON-RPC 2.0 and legacy formats
-        params = self.extract_params(message)
-        header_params = self.extract_header_params(message)
+        params, header_params = self.extract_envelope(message, is_jsonrpc)
 
         # Get connection info from header params (JSON-RPC) or message root (legacy)
         connection_id = header_params.get(
@@ -251,7 +256,6 @@ class FetchHandler(BaseActionHandler):
             raw_options,
         )
 
-        is_jsonrpc = self.is_jsonrpc_request(message)
         self.logger.info(
             "Processing fetch request",
             connection_id=connection_id,
@@ -364,7 +368,9 @@ class FetchHandler(BaseActionHandler):
         return
         yield  # noqa: unreachable - required to make this an async generator
 
-    def _validate_message(self, message: dict[str, Any]) -> None:
+    def _validate_message(
+        self, message: dict[str, Any], is_jsonrpc: bool | None = None
+    ) -> None:
         """Validate required fields in fetch message.
 
         Supports both JSON-RPC 2.0 and legacy formats:
@@ -373,12 +379,16 @@ class FetchHandler(BaseActionHandler):
 
         Args:
             message: The message to validate
+            is_jsonrpc: Precomputed is_jsonrpc_request(message), if known
 
         Raises:
             ValidationError: If required fields are missing or invalid
         """
+        if is_jsonrpc is None:
+            is_jsonrpc = self.is_jsonrpc_request(message)
+
         # JSON-RPC 2.0 format validation
-        if self.is_jsonrpc_request(message):
+        if is_jsonrpc:
             if message.get("method") != "clustera.integration.content.fetch":
                 raise ValidationError(
                     f"Invalid method for FetchHandler: {message.get('method')}",
@@ -407,7 +417,7 @@ class FetchHandler(BaseActionHandler):
                 raise ValidationError(
                     f"Unsupported resource type: {resource_type}",
                     field="resource_type",
-                    details={"supported": list(self.SUPPORTED_RESOURCE_TYPES)},
+                    details={"supported": self._SUPPORTED_RESOURCE_TYPES_SORTED},
                 )
             return
 
@@ -439,7 +449,7 @@ class FetchHandler(BaseActionHandler):
             raise ValidationError(
                 f"Unsupported resource type: {resource_type}",
                 field="resource_type",
-                details={"supported": list(self.SUPPORTED_RESOURCE_TYPES)},
+                details={"supported": self._SUPPORTED_RESOURCE_TYPES_SORTED},
             )
 
     # TODO: Implement fetch methods for each resource type
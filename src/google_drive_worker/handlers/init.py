@@ -35,8 +35,8 @@ class InitHandler(BaseActionHandler):
     connection.ready event.
     """
 
-    SUPPORTED_ACTIONS = {"init"}
-    SUPPORTED_METHODS = {"clustera.integration.connection.initialize"}
+    SUPPORTED_ACTIONS = frozenset({"init"})
+    SUPPORTED_METHODS = frozenset({"clustera.integration.connection.initialize"})
 
     # Google Drive connection capabilities (Plan 17/41)
     CAPABILITIES = {
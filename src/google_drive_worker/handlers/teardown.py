@@ -29,8 +29,8 @@ class TeardownHandler(BaseActionHandler):
     Returns no output (silent teardown per Plan 37).
     """
 
-    SUPPORTED_ACTIONS = {"teardown"}
-    SUPPORTED_METHODS = {"clustera.integration.connection.teardown"}
+    SUPPORTED_ACTIONS = frozenset({"teardown"})
+    SUPPORTED_METHODS = frozenset({"clustera.integration.connection.teardown"})
 
     def __init__(self, api_config: GoogleDriveAPIConfig) -> None:
         """Initialize teardown handler.
@@ -39,8 +39,8 @@ class WebhookHandler(BaseActionHandler):
     - Caches resolutions for 5-minute TTL
     """
 
-    SUPPORTED_ACTIONS = {"webhook"}
-    SUPPORTED_METHODS = {"clustera.integration.incoming"}
+    SUPPORTED_ACTIONS = frozenset({"webhook"})
+    SUPPORTED_METHODS = frozenset({"clustera.integration.incoming"})
 
     def __init__(
         self,
@@ -58,7 +58,9 @@ class WebhookHandler(BaseActionHandler):
         super().__init__(api_config)
         self.storage_config = storage_config or StorageConfig()
         self.provider_name = provider_name
-        self.transformer = GoogleDriveDataTransformer()
+        self.transformer = GoogleDriveDataTransformer(
+            include_debug_metadata=api_config.transform_debug
+        )
         self._content_emitter: ContentIngestEmitter | None = None
         self._connection_resolver: ConnectionResolver | None = None
 
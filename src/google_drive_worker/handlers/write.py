@@ -5,15 +5,26 @@ Performs write operations on Google Drive (upload files, update metadata, delete
 
 from __future__ import annotations
 
-from collections.abc import AsyncGenerator
+import asyncio
+import base64
+import binascii
+import logging
+from collections.abc import AsyncGenerator, Mapping
 from datetime import datetime, timezone
+from types import MappingProxyType
 from typing import Any, Literal
 
 from google_drive_worker.client.drive_api import GoogleDriveAPIClient
 from google_drive_worker.config import GoogleDriveAPIConfig
 from google_drive_worker.handlers.base import BaseActionHandler
+from google_drive_worker.normalization.mime_types import GOOGLE_FOLDER
 from google_drive_worker.schemas.write import WriteOperation, validate_write_payload
 from google_drive_worker.utils.errors import ValidationError
+from google_drive_worker.utils.walk import walk_folders
+
+# Shared read-only default for missing payload/params sections, so lookups on
+# absent keys don't allocate a fresh empty dict per message.
+_EMPTY_DICT: Mapping[str, Any] = MappingProxyType({})
 
 
 class WriteHandler(BaseActionHandler):
@@ -31,10 +42,10 @@ class WriteHandler(BaseActionHandler):
     - unshare_file: Remove sharing permissions
     """
 
-    SUPPORTED_ACTIONS = {"write"}
-    SUPPORTED_METHODS = {"clustera.integration.content.dispatch"}
+    SUPPORTED_ACTIONS = frozenset({"write"})
+    SUPPORTED_METHODS = frozenset({"clustera.integration.content.dispatch"})
 
-    SUPPORTED_OPERATIONS: set[WriteOperation] = {
+    SUPPORTED_OPERATIONS: frozenset[WriteOperation] = frozenset({
         "upload_file",
         "update_file",
         "update_metadata",
@@ -44,7 +55,22 @@ class WriteHandler(BaseActionHandler):
         "create_folder",
         "share_file",
         "unshare_file",
-    }
+    })
+    # Deterministic listing for validation error details
+    _SUPPORTED_OPERATIONS_SORTED: tuple[str, ...] = tuple(sorted(SUPPORTED_OPERATIONS))
+
+    # Operations with a write method; the rest are still TODO
+    IMPLEMENTED_OPERATIONS: frozenset[WriteOperation] = frozenset({
+        "upload_file",
+        "copy_file",
+        "move_file",
+    })
+
+    # Maximum concurrent create/copy calls when copying a folder tree level
+    COPY_CONCURRENCY = 10
+
+    # Fields fetched for file lookups before write operations
+    METADATA_FIELDS = "id,name,mimeType,parents"
 
     def __init__(self, api_config: GoogleDriveAPIConfig) -> None:
         """Initialize write handler.
@@ -68,11 +94,12 @@ class WriteHandler(BaseActionHandler):
             message: The write message
             connection_config: Connection configuration with credentials
         """
-        self._validate_message(message)
+        # Format check done once and shared with validation
+        is_jsonrpc = self.is_jsonrpc_request(message)
+        self._validate_message(message, is_jsonrpc)
 
         # Extract connection info - handles both JSON-RPC and legacy formats
-        params = self.extract_params(message)
-        header_params = self.extract_header_params(message)
+        params, header_params = self.extract_envelope(message, is_jsonrpc)
 
         connection_id = header_params.get(
             "integration_connection_id",
@@ -82,94 +109,82 @@ class WriteHandler(BaseActionHandler):
 
         # Extract operation and payload from params (JSON-RPC) or message root (legacy)
         operation: WriteOperation = params.get("operation", message.get("operation"))
-        payload = params.get("payload", message.get("payload", {}))
+        payload = params.get("payload") or message.get("payload") or _EMPTY_DICT
 
         # Validate payload for operation
         validated_payload = validate_write_payload(operation, payload)
 
-        self.logger.info(
-            "Processing write action",
-            connection_id=connection_id,
-            operation=operation,
-        )
+        if self.is_log_enabled(logging.INFO):
+            self.logger.info(
+                "Processing write action",
+                connection_id=connection_id,
+                operation=operation,
+            )
 
-        access_token = connection_config.get("access_token")
-        refresh_token = connection_config.get("refresh_token")
+        start_time = datetime.now(timezone.utc)
 
-        # TODO: Initialize Google Drive API client
-        # api_client = GoogleDriveAPIClient(
-        #     config=self.api_config,
-        #     access_token=access_token,
-        #     logger=self.logger,
-        #     refresh_token=refresh_token,
-        # )
+        # TODO: update_file, update_metadata, delete_file, create_folder,
+        # share_file and unshare_file are accepted but not implemented yet;
+        # no API client is built for them.
+        if operation not in self.IMPLEMENTED_OPERATIONS:
+            return
 
-        start_time = datetime.now(timezone.utc)
+        # Initialize Google Drive API client
+        # - access_token/refresh_token: per-user credentials from connection_config
+        # - client_id/client_secret: OAuth app credentials from worker config (env vars)
+        api_client = GoogleDriveAPIClient(
+            access_token=connection_config.get("access_token"),
+            refresh_token=connection_config.get("refresh_token"),
+            client_id=self.api_config.client_id,
+            client_secret=self.api_config.client_secret,
+        )
 
         try:
             # Route to appropriate write method
             if operation == "upload_file":
-                # TODO: async for response in self._upload_file(...): yield response
-                pass
-
-            elif operation == "update_file":
-                # TODO: async for response in self._update_file(...): yield response
-                pass
-
-            elif operation == "update_metadata":
-                # TODO: async for response in self._update_metadata(...): yield response
-                pass
-
-            elif operation == "delete_file":
-                # TODO: async for response in self._delete_file(...): yield response
-                pass
+                await self._upload_file(api_client, connection_id, validated_payload)
 
             elif operation == "copy_file":
-                # TODO: async for response in self._copy_file(...): yield response
-                pass
+                await self._copy_file(api_client, connection_id, validated_payload)
 
             elif operation == "move_file":
-                # TODO: async for response in self._move_file(...): yield response
-                pass
-
-            elif operation == "create_folder":
-                # TODO: async for response in self._create_folder(...): yield response
-                pass
-
-            elif operation == "share_file":
-                # TODO: async for response in self._share_file(...): yield response
-                pass
-
-            elif operation == "unshare_file":
-                # TODO: async for response in self._unshare_file(...): yield response
-                pass
+                await self._move_file(api_client, connection_id, validated_payload)
 
         finally:
-            # await api_client.close()
-            pass
+            await api_client.close()
+
+        # Write operations are silent, but this must remain an async generator
+        return
+        yield  # noqa: unreachable - required to make this an async generator
 
-    def _validate_message(self, message: dict[str, Any]) -> None:
+    def _validate_message(
+        self, message: dict[str, Any], is_jsonrpc: bool | None = None
+    ) -> None:
         """Validate required fields in write message.
 
         Supports both JSON-RPC 2.0 and legacy formats.
 
         Args:
             message: The message to validate
+            is_jsonrpc: Precomputed is_jsonrpc_request(message), if known
 
         Raises:
             ValidationError: If required fields are missing
         """
+        if is_jsonrpc is None:
+            is_jsonrpc = self.is_jsonrpc_request(message)
+
         # JSON-RPC 2.0 format validation
-        if self.is_jsonrpc_request(message):
+        if is_jsonrpc:
             if message.get("method") != "clustera.integration.content.dispatch":
                 raise ValidationError(
                     f"Invalid method for WriteHandler: {message.get('method')}",
                     field="method",
                 )
 
-            params = message.get("params", {})
-            header = params.get("header", {})
-            header_params = header.get("parameters", {})
+            params = message.get("params") or _EMPTY_DICT
+            header = params.get("header") or _EMPTY_DICT
+            header_params = header.get("parameters") or _EMPTY_DICT
 
             # Validate required header parameters
             if not header_params.get("integration_connection_id"):
@@ -189,7 +204,7 @@ class WriteHandler(BaseActionHandler):
                 raise ValidationError(
                     f"Unsupported operation: {operation}",
                     field="operation",
-                    details={"supported": list(self.SUPPORTED_OPERATIONS)},
+                    details={"supported": self._SUPPORTED_OPERATIONS_SORTED},
                 )
             return
 
@@ -222,17 +237,244 @@ class WriteHandler(BaseActionHandler):
             raise ValidationError(
                 f"Unsupported operation: {operation}",
                 field="operation",
-                details={"supported": list(self.SUPPORTED_OPERATIONS)},
+                details={"supported": self._SUPPORTED_OPERATIONS_SORTED},
             )
 
-    # TODO: Implement write methods for each operation
+    def _require_payload_field(self, payload: Mapping[str, Any], field: str) -> str:
+        """Return a required string field from a write payload.
+
+        Args:
+            payload: The operation payload
+            field: Name of the required field
+
+        Raises:
+            ValidationError: If the field is missing or empty
+        """
+        value = payload.get(field)
+        if not value:
+            raise ValidationError(
+                f"Missing required field: payload.{field}",
+                field=field,
+            )
+        return value
+
+    async def _upload_file(
+        self,
+        api_client: GoogleDriveAPIClient,
+        connection_id: str,
+        payload: Mapping[str, Any],
+    ) -> None:
+        """Upload a new file from inline base64 content.
+
+        Args:
+            api_client: Initialized Google Drive API client
+            connection_id: Integration connection ID (for logging)
+            payload: Operation payload (name, content, mime_type, parent_id,
+                description)
+        """
+        name = self._require_payload_field(payload, "name")
+        mime_type = payload.get("mime_type") or "application/octet-stream"
+
+        metadata: dict[str, Any] = {"name": name, "mimeType": mime_type}
+        if payload.get("parent_id"):
+            metadata["parents"] = [payload["parent_id"]]
+        if payload.get("description"):
+            metadata["description"] = payload["description"]
+
+        encoded = self._require_payload_field(payload, "content")
+        try:
+            content = base64.b64decode(encoded, validate=True)
+        except (binascii.Error, ValueError) as e:
+            raise ValidationError(
+                "Invalid base64 in payload.content",
+                field="content",
+            ) from e
+        uploaded = await api_client.upload_file(metadata, content, mime_type)
+
+        self.logger.info(
+            "File uploaded",
+            connection_id=connection_id,
+            file_id=uploaded.get("id"),
+            mime_type=mime_type,
+        )
+
+    async def _copy_file(
+        self,
+        api_client: GoogleDriveAPIClient,
+        connection_id: str,
+        payload: Mapping[str, Any],
+    ) -> None:
+        """Copy a file, or recreate a folder tree at the destination.
+
+        The Drive API cannot copy folders, so folder copies walk the source
+        tree (see walk_folders) and recreate it level by level, copying the
+        items of each level concurrently. The walk happens before anything is
+        created, and destinations inside the source tree are rejected.
+
+        Args:
+            api_client: Initialized Google Drive API client
+            connection_id: Integration connection ID (for logging)
+            payload: Operation payload (file_id, destination_folder_id, name)
+
+        Raises:
+            ValidationError: Folder copy into itself or one of its subfolders
+        """
+        file_id = self._require_payload_field(payload, "file_id")
+        destination_id = payload.get("destination_folder_id")
+        name = payload.get("name")
+
+        source = await api_client.get_file(file_id, fields=self.METADATA_FIELDS)
+
+        if source.get("mimeType") != GOOGLE_FOLDER:
+            copied = await api_client.copy_file(file_id, name=name, parent_id=destination_id)
+            self.logger.info(
+                "File copied",
+                connection_id=connection_id,
+                file_id=file_id,
+                copy_id=copied.get("id"),
+            )
+            return
+
+        if not destination_id:
+            # Copy next to the source
+            destination_id = (source.get("parents") or [None])[0]
+
+        descendants = await walk_folders(api_client, file_id, folders_only=False)
+        if destination_id == file_id or any(
+            item.get("id") == destination_id and item.get("mimeType") == GOOGLE_FOLDER
+            for item in descendants
+        ):
+            raise ValidationError(
+                "Cannot copy a folder into itself or one of its subfolders",
+                field="destination_folder_id",
+            )
+
+        root_copy = await api_client.create_folder(
+            name or source.get("name", "Untitled folder"), destination_id
+        )
+        copy_ids = {file_id: root_copy["id"]}
+        semaphore = asyncio.Semaphore(self.COPY_CONCURRENCY)
+
+        async def copy_item(item: dict[str, Any], parent_copy_id: str | None) -> None:
+            async with semaphore:
+                if item.get("mimeType") == GOOGLE_FOLDER:
+                    created = await api_client.create_folder(item.get("name", ""), parent_copy_id)
+                    copy_ids[item["id"]] = created["id"]
+                else:
+                    await api_client.copy_file(item["id"], parent_id=parent_copy_id)
+
+        items_copied = 0
+        try:
+            for level in self._split_levels(file_id, descendants):
+                # Every parent in this level was created by an earlier level
+                results = await asyncio.gather(
+                    *(
+                        copy_item(
+                            item,
+                            next(
+                                (copy_ids[p] for p in item.get("parents", []) if p in copy_ids),
+                                None,
+                            ),
+                        )
+                        for item in level
+                    ),
+                    return_exceptions=True,
+                )
+                failures = [r for r in results if isinstance(r, BaseException)]
+                items_copied += len(results) - len(failures)
+                if failures:
+                    raise failures[0]
+        except Exception:
+            # The partial tree is left in place; log what exists so it can be
+            # traced and cleaned up
+            self.logger.error(
+                "Folder copy failed partway",
+                connection_id=connection_id,
+                file_id=file_id,
+                copy_id=root_copy["id"],
+                items_copied=items_copied,
+                items_total=len(descendants),
+                folder_copy_ids=copy_ids,
+            )
+            raise
+
+        self.logger.info(
+            "Folder copied",
+            connection_id=connection_id,
+            file_id=file_id,
+            copy_id=root_copy["id"],
+            items_copied=items_copied,
+        )
+
+    @staticmethod
+    def _split_levels(
+        root_id: str, descendants: list[dict[str, Any]]
+    ) -> list[list[dict[str, Any]]]:
+        """Group walk_folders output (level order) into per-depth lists.
+
+        An item's depth is one more than that of its shallowest parent in the
+        walked tree, so every item's parent folder is in an earlier level.
+        """
+        depths = {root_id: 0}
+        levels: list[list[dict[str, Any]]] = []
+        for item in descendants:
+            depth = 1 + min(
+                (depths[p] for p in item.get("parents", []) if p in depths), default=0
+            )
+            depths[item["id"]] = depth
+            while len(levels) < depth:
+                levels.append([])
+            levels[depth - 1].append(item)
+        return levels
+
+    async def _move_file(
+        self,
+        api_client: GoogleDriveAPIClient,
+        connection_id: str,
+        payload: Mapping[str, Any],
+    ) -> None:
+        """Move a file or folder to another folder.
+
+        Folder moves walk the source tree to reject moves into the folder's
+        own subtree, which Drive would otherwise turn into a cycle.
+
+        Args:
+            api_client: Initialized Google Drive API client
+            connection_id: Integration connection ID (for logging)
+            payload: Operation payload (file_id, destination_folder_id)
+        """
+        file_id = self._require_payload_field(payload, "file_id")
+        destination_id = self._require_payload_field(payload, "destination_folder_id")
+
+        # The current parents are sent back as removeParents
+        source = await api_client.get_file(file_id, fields=self.METADATA_FIELDS)
+
+        if source.get("mimeType") == GOOGLE_FOLDER:
+            subfolders = await walk_folders(api_client, file_id)
+            if destination_id == file_id or any(f.get("id") == destination_id for f in subfolders):
+                raise ValidationError(
+                    "Cannot move a folder into itself or one of its subfolders",
+                    field="destination_folder_id",
+                )
+
+        await api_client.update_file_metadata(
+            file_id,
+            add_parents=[destination_id],
+            remove_parents=source.get("parents", []),
+        )
+
+        self.logger.info(
+            "File moved",
+            connection_id=connection_id,
+            file_id=file_id,
+            destination_folder_id=destination_id,
+        )
+
+    # TODO: Implement remaining write methods
     # Per Plan 37: All write methods are silent - they log success but DO NOT yield messages
-    # - _upload_file (upload new file)
     # - _update_file (update file content)
     # - _update_metadata (update file metadata)
     # - _delete_file (delete a file)
-    # - _copy_file (copy a file)
-    # - _move_file (move a file to another folder)
     # - _create_folder (create a new folder)
     # - _share_file (share a file with permissions)
     # - _unshare_file (remove sharing permissions)
@@ -23,6 +23,8 @@ class HealthServer:
     - /metrics: Basic metrics in JSON format
     """
 
+    __slots__ = ("worker", "host", "port", "_app", "_runner")
+
     def __init__(
         self,
         worker: GoogleDriveWorker,
@@ -1,5 +1,6 @@
 """Google Drive MIME type utilities and constants."""
 
+from functools import lru_cache
 from typing import Optional
 
 # Google Workspace MIME type constants
@@ -13,14 +14,94 @@ GOOGLE_SITE = "application/vnd.google-apps.site"
 GOOGLE_SCRIPT = "application/vnd.google-apps.script"
 GOOGLE_JAMBOARD = "application/vnd.google-apps.jam"
 
+# Per-MIME-type lookup table: (category, export format, file extension).
+# This is the single source of truth for the category, export and extension
+# lookups below; EXPORT_FORMATS and CATEGORY_MAPPINGS are derived from it.
+# Export formats prefer plain text where possible for better downstream
+# processing, and extensions for Workspace types describe the exported file.
+_MIME_INFO: dict[str, tuple[Optional[str], Optional[str], Optional[str]]] = {
+    # Google Workspace types
+    GOOGLE_DOC: ("document", "text/plain", ".txt"),  # plain text for better LLM processing
+    GOOGLE_SHEET: ("spreadsheet", "text/csv", ".csv"),  # plain text tabular data
+    GOOGLE_SLIDE: (
+        "presentation",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        ".pptx",
+    ),  # no plain text option
+    GOOGLE_FOLDER: ("folder", None, None),
+    GOOGLE_FORM: ("form", None, None),
+    GOOGLE_DRAWING: ("drawing", "image/png", ".png"),  # no plain text option for images
+    GOOGLE_SITE: ("site", None, None),
+    GOOGLE_SCRIPT: ("code", "application/vnd.google-apps.script+json", ".json"),  # already text-based
+    GOOGLE_JAMBOARD: ("whiteboard", None, None),
+
+    # Microsoft Office formats
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ("document", None, ".docx"),
+    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ("spreadsheet", None, ".xlsx"),
+    "application/vnd.openxmlformats-officedocument.presentationml.presentation": ("presentation", None, ".pptx"),
+    "application/msword": ("document", None, ".doc"),
+    "application/vnd.ms-excel": ("spreadsheet", None, ".xls"),
+    "application/vnd.ms-powerpoint": ("presentation", None, ".ppt"),
+
+    # Common document formats
+    "application/pdf": ("document", None, ".pdf"),
+    "text/plain": ("document", None, ".txt"),
+    "text/html": ("document", None, ".html"),
+    "text/csv": ("spreadsheet", None, ".csv"),
+    "application/rtf": ("document", None, ".rtf"),
+
+    # Image formats
+    "image/jpeg": ("image", None, ".jpg"),
+    "image/png": ("image", None, ".png"),
+    "image/gif": ("image", None, ".gif"),
+    "image/svg+xml": ("image", None, ".svg"),
+    "image/webp": ("image", None, ".webp"),
+    "image/bmp": ("image", None, ".bmp"),
+    "image/tiff": ("image", None, ".tiff"),
+
+    # Video formats
+    "video/mp4": ("video", None, ".mp4"),
+    "video/mpeg": ("video", None, ".mpeg"),
+    "video/quicktime": ("video", None, ".mov"),
+    "video/x-msvideo": ("video", None, ".avi"),
+    "video/webm": ("video", None, ".webm"),
+
+    # Audio formats
+    "audio/mpeg": ("audio", None, ".mp3"),
+    "audio/mp3": ("audio", None, ".mp3"),
+    "audio/wav": ("audio", None, ".wav"),
+    "audio/ogg": ("audio", None, ".ogg"),
+    "audio/webm": ("audio", None, None),
+
+    # Archive formats
+    "application/zip": ("archive", None, ".zip"),
+    "application/x-rar-compressed": ("archive", None, ".rar"),
+    "application/x-tar": ("archive", None, ".tar"),
+    "application/gzip": ("archive", None, ".gz"),
+    "application/x-7z-compressed": ("archive", None, ".7z"),
+
+    # Code/script formats
+    "text/javascript": ("code", None, ".js"),
+    "application/javascript": ("code", None, ".js"),
+    "application/json": ("code", None, ".json"),
+    "text/x-python": ("code", None, ".py"),
+    "application/x-python-code": ("code", None, None),
+    "text/x-java-source": ("code", None, ".java"),
+    "text/x-c": ("code", None, None),
+    "text/x-c++": ("code", None, None),
+    "text/markdown": ("code", None, ".md"),
+    "text/x-yaml": ("code", None, ".yaml"),
+    "application/xml": ("code", None, ".xml"),
+    "text/xml": ("code", None, ".xml"),
+}
+
+_NO_MIME_INFO: tuple[None, None, None] = (None, None, None)
+
 # Export format mappings for Google Workspace files
-# Prefer plain text formats where possible for better downstream processing
 EXPORT_FORMATS = {
-    GOOGLE_DOC: "text/plain",  # .txt - plain text for better LLM processing
-    GOOGLE_SHEET: "text/csv",  # .csv - plain text tabular data
-    GOOGLE_SLIDE: "application/vnd.openxmlformats-officedocument.presentationml.presentation",  # .pptx - no plain text option
-    GOOGLE_DRAWING: "image/png",  # .png - no plain text option for images
-    GOOGLE_SCRIPT: "application/vnd.google-apps.script+json",  # .json - already text-based
+    mime_type: export_format
+    for mime_type, (_, export_format, _) in _MIME_INFO.items()
+    if export_format is not None
 }
 
 # Set of all Google Workspace MIME types
@@ -38,75 +119,9 @@ GOOGLE_WORKSPACE_TYPES = {
 
 # File category mappings
 CATEGORY_MAPPINGS = {
-    # Google Workspace types
-    GOOGLE_DOC: "document",
-    GOOGLE_SHEET: "spreadsheet",
-    GOOGLE_SLIDE: "presentation",
-    GOOGLE_FOLDER: "folder",
-    GOOGLE_FORM: "form",
-    GOOGLE_DRAWING: "drawing",
-    GOOGLE_SITE: "site",
-    GOOGLE_SCRIPT: "code",
-    GOOGLE_JAMBOARD: "whiteboard",
-
-    # Microsoft Office formats
-    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": "document",
-    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": "spreadsheet",
-    "application/vnd.openxmlformats-officedocument.presentationml.presentation": "presentation",
-    "application/msword": "document",
-    "application/vnd.ms-excel": "spreadsheet",
-    "application/vnd.ms-powerpoint": "presentation",
-
-    # Common document formats
-    "application/pdf": "document",
-    "text/plain": "document",
-    "text/html": "document",
-    "text/csv": "spreadsheet",
-    "application/rtf": "document",
-
-    # Image formats
-    "image/jpeg": "image",
-    "image/png": "image",
-    "image/gif": "image",
-    "image/svg+xml": "image",
-    "image/webp": "image",
-    "image/bmp": "image",
-    "image/tiff": "image",
-
-    # Video formats
-    "video/mp4": "video",
-    "video/mpeg": "video",
-    "video/quicktime": "video",
-    "video/x-msvideo": "video",
-    "video/webm": "video",
-
-    # Audio formats
-    "audio/mpeg": "audio",
-    "audio/mp3": "audio",
-    "audio/wav": "audio",
-    "audio/ogg": "audio",
-    "audio/webm": "audio",
-
-    # Archive formats
-    "application/zip": "archive",
-    "application/x-rar-compressed": "archive",
-    "application/x-tar": "archive",
-    "application/gzip": "archive",
-    "application/x-7z-compressed": "archive",
-
-    # Code/script formats
-    "text/javascript": "code",
-    "application/javascript": "code",
-    "application/json": "code",
-    "text/x-python": "code",
-    "application/x-python-code": "code",
-    "text/x-java-source": "code",
-    "text/x-c": "code",
-    "text/x-c++": "code",
-    "text/markdown": "code",
-    "text/x-yaml": "code",
-    "application/xml": "code",
-    "text/xml": "code",
+    mime_type: category
+    for mime_type, (category, _, _) in _MIME_INFO.items()
+    if category is not None
 }
 
 
@@ -146,7 +161,7 @@ def get_export_format(mime_type: str) -> Optional[str]:
     Returns:
         Export MIME type if available, None otherwise
     """
-    return EXPORT_FORMATS.get(mime_type)
+    return (_MIME_INFO.get(mime_type) or _NO_MIME_INFO)[1]
 
 
 def get_file_category(mime_type: str) -> str:
@@ -161,10 +176,16 @@ def get_file_category(mime_type: str) -> str:
         Returns 'other' if no category matches
     """
     # Check direct mapping first
-    if mime_type in CATEGORY_MAPPINGS:
-        return CATEGORY_MAPPINGS[mime_type]
+    category = (_MIME_INFO.get(mime_type) or _NO_MIME_INFO)[0]
+    if category is not None:
+        return category
+
+    return _category_from_prefix(mime_type)
+
 
-    # Try to infer from MIME type prefix
+@lru_cache(maxsize=256)
+def _category_from_prefix(mime_type: str) -> str:
+    """Infer a category from the MIME type prefix (cached per MIME type)."""
     if mime_type.startswith("image/"):
         return "image"
     elif mime_type.startswith("video/"):
@@ -203,66 +224,54 @@ def get_file_extension(mime_type: str) -> Optional[str]:
     Returns:
         File extension with dot (e.g., '.pdf'), None if unknown
     """
-    extension_map = {
-        # Google Workspace (when exported)
-        GOOGLE_DOC: ".txt",
-        GOOGLE_SHEET: ".csv",
-        GOOGLE_SLIDE: ".pptx",
-        GOOGLE_DRAWING: ".png",
-        GOOGLE_SCRIPT: ".json",
-
-        # Documents
-        "application/pdf": ".pdf",
-        "text/plain": ".txt",
-        "text/html": ".html",
-        "text/csv": ".csv",
-        "application/rtf": ".rtf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
-        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet": ".xlsx",
-        "application/vnd.openxmlformats-officedocument.presentationml.presentation": ".pptx",
-        "application/msword": ".doc",
-        "application/vnd.ms-excel": ".xls",
-        "application/vnd.ms-powerpoint": ".ppt",
-
-        # Images
-        "image/jpeg": ".jpg",
-        "image/png": ".png",
-        "image/gif": ".gif",
-        "image/svg+xml": ".svg",
-        "image/webp": ".webp",
-        "image/bmp": ".bmp",
-        "image/tiff": ".tiff",
-
-        # Videos
-        "video/mp4": ".mp4",
-        "video/mpeg": ".mpeg",
-        "video/quicktime": ".mov",
-        "video/x-msvideo": ".avi",
-        "video/webm": ".webm",
-
-        # Audio
-        "audio/mpeg": ".mp3",
-        "audio/mp3": ".mp3",
-        "audio/wav": ".wav",
-        "audio/ogg": ".ogg",
-
-        # Archives
-        "application/zip": ".zip",
-        "application/x-rar-compressed": ".rar",
-        "application/x-tar": ".tar",
-        "application/gzip": ".gz",
-        "application/x-7z-compressed": ".7z",
-
-        # Code
-        "text/javascript": ".js",
-        "application/javascript": ".js",
-        "application/json": ".json",
-        "text/x-python": ".py",
-        "text/x-java-source": ".java",
-        "text/markdown": ".md",
-        "text/x-yaml": ".yaml",
-        "application/xml": ".xml",
-        "text/xml": ".xml",
-    }
-
-    return extension_map.get(mime_type)
\ No newline at end of file
+    return (_MIME_INFO.get(mime_type) or _NO_MIME_INFO)[2]
+
+
+# Fused classification: (is_folder, is_workspace, category, export_format,
+# extension, needs_export). Precomputed for every known MIME type so the
+# transformer resolves all six attributes with a single dict lookup.
+MimeClassification = tuple[bool, bool, str, Optional[str], Optional[str], bool]
+
+
+def _classify(mime_type: str) -> MimeClassification:
+    """Compute the fused classification tuple for a MIME type."""
+    return (
+        is_folder(mime_type),
+        is_google_workspace_file(mime_type),
+        get_file_category(mime_type),
+        get_export_format(mime_type),
+        get_file_extension(mime_type),
+        needs_export(mime_type),
+    )
+
+
+_MIME_CLASSIFICATION: dict[str, MimeClassification] = {
+    mime_type: _classify(mime_type) for mime_type in _MIME_INFO.keys() | GOOGLE_WORKSPACE_TYPES
+}
+
+_get_classification = _MIME_CLASSIFICATION.get
+
+
+@lru_cache(maxsize=1024)
+def _classify_unknown(mime_type: str) -> MimeClassification:
+    """Classify a MIME type missing from the table (prefix fallback), cached."""
+    return _classify(mime_type)
+
+
+def classify_mime(mime_type: str) -> MimeClassification:
+    """
+    Classify a MIME type in one call.
+
+    Equivalent to calling is_folder, is_google_workspace_file,
+    get_file_category, get_export_format, get_file_extension and needs_export
+    on the same MIME type.
+
+    Args:
+        mime_type: MIME type string
+
+    Returns:
+        Tuple of (is_folder, is_workspace, category, export_format, extension,
+        needs_export)
+    """
+    # Classification tuples are never empty, so a miss is the only falsy result
+    return _get_classification(mime_type) or _classify_unknown(mime_type)
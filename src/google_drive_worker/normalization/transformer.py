@@ -1,33 +1,101 @@
 """Google Drive data transformer for normalizing API responses."""
 
 import logging
+import sys
 from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from .mime_types import (
-    get_export_format,
-    get_file_category,
-    get_file_extension,
-    is_folder,
-    is_google_workspace_file,
-    needs_export,
-)
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from .mime_types import classify_mime
 
 logger = logging.getLogger(__name__)
 
+# Source fields shared by a batch of records; read-only when handed to callers
+SourceTemplate = Union[Dict[str, Any], MappingProxyType[str, Any]]
+
+# Optional file fields copied verbatim, in output order: (API key, normalized key)
+_OPTIONAL_STR_FIELD_NAMES = (
+    ("webViewLink", "web_view_link"),
+    ("webContentLink", "web_content_link"),
+    ("thumbnailLink", "thumbnail_link"),
+    ("version", "version"),
+    ("md5Checksum", "md5_checksum"),
+    ("sha1Checksum", "sha1_checksum"),
+    ("sha256Checksum", "sha256_checksum"),
+    ("description", "description"),
+)
+OPTIONAL_STR_FIELDS = frozenset(key for key, _ in _OPTIONAL_STR_FIELD_NAMES)
+
+
+def _parse_timestamp(timestamp_str: str) -> str:
+    """
+    Parse and normalize timestamp string.
+
+    Args:
+        timestamp_str: Timestamp string from API
+
+    Returns:
+        ISO format timestamp string
+    """
+    # Google Drive API returns RFC3339 format, which is already ISO-compatible;
+    # the Z-suffixed common case returns on the first check
+    if not timestamp_str or timestamp_str.endswith("Z"):
+        return timestamp_str
+    return timestamp_str[:-6] + "Z" if timestamp_str.endswith("+00:00") else timestamp_str
+
+
+def _to_user(user: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a Drive user object (owner, author, last modifying user)."""
+    return {
+        "name": user.get("displayName", "Unknown"),
+        "email": user.get("emailAddress"),
+        "photo_link": user.get("photoLink"),
+    }
+
+
+def _to_permission_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize one entry of a permission's permissionDetails."""
+    return {
+        "permission_type": detail.get("permissionType"),
+        "role": detail.get("role"),
+        "inherited_from": detail.get("inheritedFrom"),
+        "inherited": detail.get("inherited", False),
+    }
+
+
+def _to_team_drive_permission_detail(detail: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize one entry of a permission's teamDrivePermissionDetails."""
+    return {
+        "team_drive_permission_type": detail.get("teamDrivePermissionType"),
+        "role": detail.get("role"),
+        "inherited_from": detail.get("inheritedFrom"),
+        "inherited": detail.get("inherited", False),
+    }
+
 
 class GoogleDriveDataTransformer:
     """Transform Google Drive API responses to normalized format."""
 
-    def __init__(self):
-        """Initialize the transformer."""
+    def __init__(self, include_debug_metadata: bool = False):
+        """
+        Initialize the transformer.
+
+        Args:
+            include_debug_metadata: Add a "_metadata" debug summary of the raw
+                API response to every normalized file
+        """
         self.transformation_version = "1.0.0"
+        self._debug = include_debug_metadata
+        # Files skipped by the batch transforms because they failed to transform
+        self.transform_failures = 0
 
     def transform_file(
         self,
         raw_file: Dict[str, Any],
         connection_id: str,
         customer_id: str,
+        transformed_at: Optional[str] = None,
+        source_template: Optional[SourceTemplate] = None,
     ) -> Dict[str, Any]:
         """
         Transform Google Drive file API response to normalized format.
@@ -36,6 +104,10 @@ class GoogleDriveDataTransformer:
             raw_file: Raw file data from Google Drive API
             connection_id: Integration connection ID
             customer_id: Customer ID
+            transformed_at: Transformation timestamp to record; defaults to now.
+                Batch callers pass one value so it is formatted once per batch.
+            source_template: Shared source fields from source_template(); when
+                given, connection_id, customer_id and transformed_at are ignored
 
         Returns:
             Normalized file data dictionary
@@ -84,26 +156,52 @@ class GoogleDriveDataTransformer:
                 }
             }
         """
-        file_id = raw_file.get("id", "")
-        mime_type = raw_file.get("mimeType", "application/octet-stream")
+        if source_template is None:
+            source_template = self._base_source(connection_id, customer_id, transformed_at)
+        return self._build_file(raw_file, source_template)
+
+    def _build_file(
+        self,
+        raw_file: Dict[str, Any],
+        base_source: SourceTemplate,
+    ) -> Dict[str, Any]:
+        """
+        Build the normalized file dict on top of a shared source template.
+
+        Args:
+            raw_file: Raw file data from Google Drive API
+            base_source: Source fields shared by every record in a batch;
+                copied, never mutated
+
+        Returns:
+            Normalized file data dictionary
+        """
+        get = raw_file.get
+        file_id = get("id", "")
+        # Drive uses a few dozen distinct MIME types; interning collapses the
+        # per-file copies parsed from JSON into one shared string each
+        mime_type = sys.intern(get("mimeType", "application/octet-stream"))
 
         # Determine file attributes based on MIME type
-        is_folder_item = is_folder(mime_type)
-        is_workspace = is_google_workspace_file(mime_type)
-        category = get_file_category(mime_type)
-        export_format = get_export_format(mime_type) if is_workspace else None
-        file_extension = get_file_extension(mime_type)
+        (
+            is_folder_item,
+            is_workspace,
+            category,
+            export_format,
+            file_extension,
+            mime_needs_export,
+        ) = classify_mime(mime_type)
 
         # Build normalized structure
         normalized = {
             "id": file_id,
             "type": "folder" if is_folder_item else "file",
-            "name": raw_file.get("name", "Unnamed"),
+            "name": get("name", "Unnamed"),
             "mime_type": mime_type,
             "category": category,
             "is_folder": is_folder_item,
             "is_google_workspace": is_workspace,
-            "needs_export": needs_export(mime_type),
+            "needs_export": mime_needs_export,
         }
 
         # Add export format if applicable
@@ -123,37 +221,24 @@ class GoogleDriveDataTransformer:
         else:
             normalized["size_bytes"] = None  # Google Workspace files
 
-        # Add web links
-        if "webViewLink" in raw_file:
-            normalized["web_view_link"] = raw_file["webViewLink"]
-
-        if "webContentLink" in raw_file:
-            normalized["web_content_link"] = raw_file["webContentLink"]
-
-        if "thumbnailLink" in raw_file:
-            normalized["thumbnail_link"] = raw_file["thumbnailLink"]
+        # Add web links, version, checksums and description (copied as-is).
+        # One set intersection finds the present fields, so files missing most
+        # of them (the common case for "metadata" fetches) skip the per-key tests.
+        present = raw_file.keys() & OPTIONAL_STR_FIELDS
+        if present:
+            for key, field in _OPTIONAL_STR_FIELD_NAMES:
+                if key in present:
+                    normalized[field] = raw_file[key]
 
         # Add parent folder IDs
-        normalized["parent_ids"] = raw_file.get("parents", [])
+        normalized["parent_ids"] = get("parents", [])
 
         # Transform owners
-        owners = []
-        for owner in raw_file.get("owners", []):
-            owners.append({
-                "name": owner.get("displayName", "Unknown"),
-                "email": owner.get("emailAddress"),
-                "photo_link": owner.get("photoLink"),
-            })
-        normalized["owners"] = owners
+        normalized["owners"] = [_to_user(owner) for owner in get("owners", [])]
 
         # Transform last modifying user
         if "lastModifyingUser" in raw_file:
-            user = raw_file["lastModifyingUser"]
-            normalized["last_modified_by"] = {
-                "name": user.get("displayName", "Unknown"),
-                "email": user.get("emailAddress"),
-                "photo_link": user.get("photoLink"),
-            }
+            normalized["last_modified_by"] = _to_user(raw_file["lastModifyingUser"])
 
         # Add file capabilities (what the user can do)
         if "capabilities" in raw_file:
@@ -171,26 +256,26 @@ class GoogleDriveDataTransformer:
             }
 
         # Add flags
-        normalized["trashed"] = raw_file.get("trashed", False)
-        normalized["starred"] = raw_file.get("starred", False)
-        normalized["explicitly_trashed"] = raw_file.get("explicitlyTrashed", False)
+        normalized["trashed"] = get("trashed", False)
+        normalized["starred"] = get("starred", False)
+        normalized["explicitly_trashed"] = get("explicitlyTrashed", False)
 
         # Add sharing information
-        normalized["shared"] = raw_file.get("shared", False)
-        normalized["viewed_by_me"] = raw_file.get("viewedByMe", False)
+        normalized["shared"] = get("shared", False)
+        normalized["viewed_by_me"] = get("viewedByMe", False)
 
         # Add timestamps
         timestamps = {}
         if "createdTime" in raw_file:
-            timestamps["created_at"] = self._parse_timestamp(raw_file["createdTime"])
+            timestamps["created_at"] = _parse_timestamp(raw_file["createdTime"])
         if "modifiedTime" in raw_file:
-            timestamps["modified_at"] = self._parse_timestamp(raw_file["modifiedTime"])
+            timestamps["modified_at"] = _parse_timestamp(raw_file["modifiedTime"])
         if "viewedByMeTime" in raw_file:
-            timestamps["viewed_by_me_at"] = self._parse_timestamp(raw_file["viewedByMeTime"])
+            timestamps["viewed_by_me_at"] = _parse_timestamp(raw_file["viewedByMeTime"])
         if "sharedWithMeTime" in raw_file:
-            timestamps["shared_with_me_at"] = self._parse_timestamp(raw_file["sharedWithMeTime"])
+            timestamps["shared_with_me_at"] = _parse_timestamp(raw_file["sharedWithMeTime"])
         if "trashedTime" in raw_file:
-            timestamps["trashed_at"] = self._parse_timestamp(raw_file["trashedTime"])
+            timestamps["trashed_at"] = _parse_timestamp(raw_file["trashedTime"])
 
         normalized["timestamps"] = timestamps
 
@@ -201,45 +286,23 @@ class GoogleDriveDataTransformer:
             except (ValueError, TypeError):
                 normalized["quota_bytes_used"] = 0
 
-        # Add version information
-        if "version" in raw_file:
-            normalized["version"] = raw_file["version"]
-
-        # Add file metadata
-        if "md5Checksum" in raw_file:
-            normalized["md5_checksum"] = raw_file["md5Checksum"]
-
-        if "sha1Checksum" in raw_file:
-            normalized["sha1_checksum"] = raw_file["sha1Checksum"]
-
-        if "sha256Checksum" in raw_file:
-            normalized["sha256_checksum"] = raw_file["sha256Checksum"]
-
-        # Add description if present
-        if "description" in raw_file:
-            normalized["description"] = raw_file["description"]
-
         # Add folder-specific information
         if is_folder_item and "folderColorRgb" in raw_file:
             normalized["folder_color_rgb"] = raw_file["folderColorRgb"]
 
         # Add source metadata
-        normalized["source"] = {
-            "provider": "google-drive",
-            "file_id": file_id,
-            "connection_id": connection_id,
-            "customer_id": customer_id,
-            "transformation_version": self.transformation_version,
-            "transformed_at": datetime.utcnow().isoformat() + "Z",
-        }
-
-        # Add original fields count for debugging
-        normalized["_metadata"] = {
-            "original_field_count": len(raw_file),
-            "has_permissions": "permissions" in raw_file,
-            "has_app_properties": "appProperties" in raw_file,
-            "has_properties": "properties" in raw_file,
-        }
+        source = base_source.copy()
+        source["file_id"] = file_id
+        normalized["source"] = source
+
+        # Add original fields count for debugging (opt-in)
+        if self._debug:
+            normalized["_metadata"] = {
+                "original_field_count": len(raw_file),
+                "has_permissions": "permissions" in raw_file,
+                "has_app_properties": "appProperties" in raw_file,
+                "has_properties": "properties" in raw_file,
+            }
 
         return normalized
 
@@ -249,6 +312,8 @@ class GoogleDriveDataTransformer:
         file_id: str,
         connection_id: str,
         customer_id: str,
+        transformed_at: Optional[str] = None,
+        source_template: Optional[SourceTemplate] = None,
     ) -> Dict[str, Any]:
         """
         Transform file revision to normalized format.
@@ -258,20 +323,25 @@ class GoogleDriveDataTransformer:
             file_id: File ID this revision belongs to
             connection_id: Integration connection ID
             customer_id: Customer ID
+            transformed_at: Transformation timestamp to record; defaults to now.
+                Batch callers pass one value so it is formatted once per batch.
+            source_template: Shared source fields from source_template(); when
+                given, connection_id, customer_id and transformed_at are ignored
 
         Returns:
             Normalized revision data dictionary
         """
-        revision_id = raw_revision.get("id", "")
+        get = raw_revision.get
+        revision_id = get("id", "")
 
         normalized = {
             "id": revision_id,
             "file_id": file_id,
             "type": "revision",
-            "keep_forever": raw_revision.get("keepForever", False),
-            "published": raw_revision.get("published", False),
-            "publish_auto": raw_revision.get("publishAuto", False),
-            "published_outside_domain": raw_revision.get("publishedOutsideDomain", False),
+            "keep_forever": get("keepForever", False),
+            "published": get("published", False),
+            "publish_auto": get("publishAuto", False),
+            "published_outside_domain": get("publishedOutsideDomain", False),
         }
 
         # Add mime type if present
@@ -291,17 +361,12 @@ class GoogleDriveDataTransformer:
 
         # Add last modifying user
         if "lastModifyingUser" in raw_revision:
-            user = raw_revision["lastModifyingUser"]
-            normalized["last_modified_by"] = {
-                "name": user.get("displayName", "Unknown"),
-                "email": user.get("emailAddress"),
-                "photo_link": user.get("photoLink"),
-            }
+            normalized["last_modified_by"] = _to_user(raw_revision["lastModifyingUser"])
 
         # Add timestamps
         timestamps = {}
         if "modifiedTime" in raw_revision:
-            timestamps["modified_at"] = self._parse_timestamp(raw_revision["modifiedTime"])
+            timestamps["modified_at"] = _parse_timestamp(raw_revision["modifiedTime"])
 
         normalized["timestamps"] = timestamps
 
@@ -310,15 +375,13 @@ class GoogleDriveDataTransformer:
             normalized["export_links"] = raw_revision["exportLinks"]
 
         # Add source metadata
-        normalized["source"] = {
-            "provider": "google-drive",
-            "file_id": file_id,
-            "revision_id": revision_id,
-            "connection_id": connection_id,
-            "customer_id": customer_id,
-            "transformation_version": self.transformation_version,
-            "transformed_at": datetime.utcnow().isoformat() + "Z",
-        }
+        if source_template is not None:
+            source = source_template.copy()
+        else:
+            source = self._base_source(connection_id, customer_id, transformed_at)
+        source["file_id"] = file_id
+        source["revision_id"] = revision_id
+        normalized["source"] = source
 
         return normalized
 
@@ -328,6 +391,8 @@ class GoogleDriveDataTransformer:
         file_id: str,
         connection_id: str,
         customer_id: str,
+        transformed_at: Optional[str] = None,
+        source_template: Optional[SourceTemplate] = None,
     ) -> Dict[str, Any]:
         """
         Transform permission (sharing) to normalized format.
@@ -337,24 +402,29 @@ class GoogleDriveDataTransformer:
             file_id: File ID this permission belongs to
             connection_id: Integration connection ID
             customer_id: Customer ID
+            transformed_at: Transformation timestamp to record; defaults to now.
+                Batch callers pass one value so it is formatted once per batch.
+            source_template: Shared source fields from source_template(); when
+                given, connection_id, customer_id and transformed_at are ignored
 
         Returns:
             Normalized permission data dictionary
         """
-        permission_id = raw_permission.get("id", "")
+        get = raw_permission.get
+        permission_id = get("id", "")
 
         normalized = {
             "id": permission_id,
             "file_id": file_id,
             "type": "permission",
-            "permission_type": raw_permission.get("type", ""),  # user, group, domain, anyone
-            "role": raw_permission.get("role", ""),  # owner, organizer, fileOrganizer, writer, commenter, reader
-            "display_name": raw_permission.get("displayName", ""),
-            "email_address": raw_permission.get("emailAddress"),
-            "domain": raw_permission.get("domain"),
-            "allow_file_discovery": raw_permission.get("allowFileDiscovery", False),
-            "deleted": raw_permission.get("deleted", False),
-            "pending_owner": raw_permission.get("pendingOwner", False),
+            "permission_type": get("type", ""),  # user, group, domain, anyone
+            "role": get("role", ""),  # owner, organizer, fileOrganizer, writer, commenter, reader
+            "display_name": get("displayName", ""),
+            "email_address": get("emailAddress"),
+            "domain": get("domain"),
+            "allow_file_discovery": get("allowFileDiscovery", False),
+            "deleted": get("deleted", False),
+            "pending_owner": get("pendingOwner", False),
         }
 
         # Add photo link if present
@@ -363,42 +433,29 @@ class GoogleDriveDataTransformer:
 
         # Add expiration time if present
         if "expirationTime" in raw_permission:
-            normalized["expiration_time"] = self._parse_timestamp(raw_permission["expirationTime"])
+            normalized["expiration_time"] = _parse_timestamp(raw_permission["expirationTime"])
 
         # Add permission details if present
         if "permissionDetails" in raw_permission:
-            details = []
-            for detail in raw_permission["permissionDetails"]:
-                details.append({
-                    "permission_type": detail.get("permissionType"),
-                    "role": detail.get("role"),
-                    "inherited_from": detail.get("inheritedFrom"),
-                    "inherited": detail.get("inherited", False),
-                })
-            normalized["permission_details"] = details
+            normalized["permission_details"] = [
+                _to_permission_detail(detail) for detail in raw_permission["permissionDetails"]
+            ]
 
         # Add team drive permission details if present
         if "teamDrivePermissionDetails" in raw_permission:
-            td_details = []
-            for detail in raw_permission["teamDrivePermissionDetails"]:
-                td_details.append({
-                    "team_drive_permission_type": detail.get("teamDrivePermissionType"),
-                    "role": detail.get("role"),
-                    "inherited_from": detail.get("inheritedFrom"),
-                    "inherited": detail.get("inherited", False),
-                })
-            normalized["team_drive_permission_details"] = td_details
+            normalized["team_drive_permission_details"] = [
+                _to_team_drive_permission_detail(detail)
+                for detail in raw_permission["teamDrivePermissionDetails"]
+            ]
 
         # Add source metadata
-        normalized["source"] = {
-            "provider": "google-drive",
-            "file_id": file_id,
-            "permission_id": permission_id,
-            "connection_id": connection_id,
-            "customer_id": customer_id,
-            "transformation_version": self.transformation_version,
-            "transformed_at": datetime.utcnow().isoformat() + "Z",
-        }
+        if source_template is not None:
+            source = source_template.copy()
+        else:
+            source = self._base_source(connection_id, customer_id, transformed_at)
+        source["file_id"] = file_id
+        source["permission_id"] = permission_id
+        normalized["source"] = source
 
         return normalized
 
@@ -408,6 +465,8 @@ class GoogleDriveDataTransformer:
         file_id: str,
         connection_id: str,
         customer_id: str,
+        transformed_at: Optional[str] = None,
+        source_template: Optional[SourceTemplate] = None,
     ) -> Dict[str, Any]:
         """
         Transform comment to normalized format.
@@ -417,36 +476,36 @@ class GoogleDriveDataTransformer:
             file_id: File ID this comment belongs to
             connection_id: Integration connection ID
             customer_id: Customer ID
+            transformed_at: Transformation timestamp to record; defaults to now.
+                Batch callers pass one value so it is formatted once per batch.
+            source_template: Shared source fields from source_template(); when
+                given, connection_id, customer_id and transformed_at are ignored
 
         Returns:
             Normalized comment data dictionary
         """
-        comment_id = raw_comment.get("id", "")
+        get = raw_comment.get
+        comment_id = get("id", "")
 
         normalized = {
             "id": comment_id,
             "file_id": file_id,
             "type": "comment",
-            "content": raw_comment.get("content", ""),
-            "resolved": raw_comment.get("resolved", False),
-            "deleted": raw_comment.get("deleted", False),
+            "content": get("content", ""),
+            "resolved": get("resolved", False),
+            "deleted": get("deleted", False),
         }
 
         # Add author information
         if "author" in raw_comment:
-            author = raw_comment["author"]
-            normalized["author"] = {
-                "name": author.get("displayName", "Unknown"),
-                "email": author.get("emailAddress"),
-                "photo_link": author.get("photoLink"),
-            }
+            normalized["author"] = _to_user(raw_comment["author"])
 
         # Add timestamps
         timestamps = {}
         if "createdTime" in raw_comment:
-            timestamps["created_at"] = self._parse_timestamp(raw_comment["createdTime"])
+            timestamps["created_at"] = _parse_timestamp(raw_comment["createdTime"])
         if "modifiedTime" in raw_comment:
-            timestamps["modified_at"] = self._parse_timestamp(raw_comment["modifiedTime"])
+            timestamps["modified_at"] = _parse_timestamp(raw_comment["modifiedTime"])
 
         normalized["timestamps"] = timestamps
 
@@ -462,19 +521,14 @@ class GoogleDriveDataTransformer:
 
                 # Add reply author
                 if "author" in reply:
-                    reply_author = reply["author"]
-                    reply_data["author"] = {
-                        "name": reply_author.get("displayName", "Unknown"),
-                        "email": reply_author.get("emailAddress"),
-                        "photo_link": reply_author.get("photoLink"),
-                    }
+                    reply_data["author"] = _to_user(reply["author"])
 
                 # Add reply timestamps
                 reply_timestamps = {}
                 if "createdTime" in reply:
-                    reply_timestamps["created_at"] = self._parse_timestamp(reply["createdTime"])
+                    reply_timestamps["created_at"] = _parse_timestamp(reply["createdTime"])
                 if "modifiedTime" in reply:
-                    reply_timestamps["modified_at"] = self._parse_timestamp(reply["modifiedTime"])
+                    reply_timestamps["modified_at"] = _parse_timestamp(reply["modifiedTime"])
                 reply_data["timestamps"] = reply_timestamps
 
                 replies.append(reply_data)
@@ -483,15 +537,13 @@ class GoogleDriveDataTransformer:
             normalized["reply_count"] = len(replies)
 
         # Add source metadata
-        normalized["source"] = {
-            "provider": "google-drive",
-            "file_id": file_id,
-            "comment_id": comment_id,
-            "connection_id": connection_id,
-            "customer_id": customer_id,
-            "transformation_version": self.transformation_version,
-            "transformed_at": datetime.utcnow().isoformat() + "Z",
-        }
+        if source_template is not None:
+            source = source_template.copy()
+        else:
+            source = self._base_source(connection_id, customer_id, transformed_at)
+        source["file_id"] = file_id
+        source["comment_id"] = comment_id
+        normalized["source"] = source
 
         return normalized
 
@@ -504,6 +556,9 @@ class GoogleDriveDataTransformer:
         """
         Transform a batch of files.
 
+        Prefer iter_transform_files when the results are consumed one at a
+        time, to avoid holding the whole normalized batch in memory.
+
         Args:
             raw_files: List of raw file data from Google Drive API
             connection_id: Integration connection ID
@@ -512,34 +567,98 @@ class GoogleDriveDataTransformer:
         Returns:
             List of normalized file data dictionaries
         """
-        normalized_files = []
+        return list(self.iter_transform_files(raw_files, connection_id, customer_id))
+
+    def iter_transform_files(
+        self,
+        raw_files: Iterable[Dict[str, Any]],
+        connection_id: str,
+        customer_id: str,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily transform a stream of files.
+
+        Files that fail to transform are logged and skipped.
+
+        Args:
+            raw_files: Raw file data from Google Drive API
+            connection_id: Integration connection ID
+            customer_id: Customer ID
+
+        Yields:
+            Normalized file data dictionaries
+        """
+        base_source = self.source_template(sys.intern(connection_id), sys.intern(customer_id))
         for raw_file in raw_files:
             try:
-                normalized = self.transform_file(raw_file, connection_id, customer_id)
-                normalized_files.append(normalized)
+                normalized = self._build_file(raw_file, base_source)
             except Exception as e:
+                self.transform_failures += 1
                 logger.error(
-                    f"Failed to transform file {raw_file.get('id', 'unknown')}: {e}",
+                    "Failed to transform file %s: %s",
+                    raw_file.get("id", "unknown"),
+                    e,
                     exc_info=True,
                 )
                 # Continue processing other files
                 continue
+            yield normalized
+
+    def source_template(
+        self,
+        connection_id: str,
+        customer_id: str,
+        transformed_at: Optional[str] = None,
+    ) -> MappingProxyType[str, Any]:
+        """
+        Build a read-only source template to share across a batch of records.
+
+        Pass it as source_template to transform_revision, transform_permission
+        or transform_comment; each record copies it and adds its own IDs.
+
+        Args:
+            connection_id: Integration connection ID
+            customer_id: Customer ID
+            transformed_at: Transformation timestamp; defaults to now
 
-        return normalized_files
+        Returns:
+            Read-only view of the shared source metadata fields
+        """
+        return MappingProxyType(self._base_source(connection_id, customer_id, transformed_at))
 
-    def _parse_timestamp(self, timestamp_str: str) -> str:
+    def _base_source(
+        self,
+        connection_id: str,
+        customer_id: str,
+        transformed_at: Optional[str] = None,
+    ) -> Dict[str, Any]:
         """
-        Parse and normalize timestamp string.
+        Build the source metadata fields common to every record type.
 
         Args:
-            timestamp_str: Timestamp string from API
+            connection_id: Integration connection ID
+            customer_id: Customer ID
+            transformed_at: Transformation timestamp; defaults to now
+
+        Returns:
+            Source metadata dictionary without record-specific IDs
+        """
+        return {
+            "provider": "google-drive",
+            "connection_id": connection_id,
+            "customer_id": customer_id,
+            "transformation_version": self.transformation_version,
+            "transformed_at": transformed_at or self._now_iso(),
+        }
+
+    def _now_iso(self) -> str:
+        """
+        Get the current UTC time as an ISO 8601 string with Z suffix.
 
         Returns:
-            ISO format timestamp string
+            Current timestamp string
         """
-        # Google Drive API returns RFC3339 format, which is already ISO-compatible
-        # Just ensure it has the Z suffix for UTC
-        if timestamp_str and not timestamp_str.endswith("Z"):
-            if timestamp_str.endswith("+00:00"):
-                timestamp_str = timestamp_str[:-6] + "Z"
-        return timestamp_str
\ No newline at end of file
+        return datetime.utcnow().isoformat() + "Z"
+
+    # Kept as a method for callers that used it before it moved to module level
+    _parse_timestamp = staticmethod(_parse_timestamp)
@@ -49,8 +49,8 @@ def parse_fetch_params(
     Returns:
         Tuple of (filters, pagination, options) validated models
     """
-    filters = FetchFilters(**raw_filters)
-    pagination = FetchPagination(**raw_pagination)
-    options = FetchOptions(**raw_options)
+    filters = FetchFilters.model_validate(raw_filters)
+    pagination = FetchPagination.model_validate(raw_pagination)
+    options = FetchOptions.model_validate(raw_options)
 
     return filters, pagination, options
@@ -5,9 +5,10 @@ Pydantic models for validating and parsing write request payloads.
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
 # Supported write operations
 WriteOperation = Literal[
@@ -23,7 +24,9 @@ WriteOperation = Literal[
 ]
 
 
-def validate_write_payload(operation: WriteOperation, payload: dict[str, Any]) -> dict[str, Any]:
+def validate_write_payload(
+    operation: WriteOperation, payload: Mapping[str, Any]
+) -> Mapping[str, Any]:
     """Validate write operation payload.
 
     TODO: Implement validation schemas for each operation type.
@@ -3,15 +3,29 @@
 Prevents cascading failures by temporarily blocking calls to failing services.
 """
 
+from collections import deque
 from enum import Enum
-from datetime import datetime, timedelta
+from datetime import datetime, timezone
 from typing import Callable, Any, Optional, TypeVar, Coroutine
 import asyncio
+import logging
+import math
+import random
+import time
 import structlog
 
+from .errors import CircuitOpenError
+
 T = TypeVar("T")
 
 logger = structlog.get_logger()
+# stdlib logger that structlog's LoggerFactory resolves for this module; used
+# for cheap level checks on paths hit once per rejected call
+_stdlib_logger = logging.getLogger(__name__)
+
+# retry_after (seconds) for calls rejected while the half-open probe runs; the
+# probe usually settles the circuit within about a request's duration
+HALF_OPEN_RETRY_AFTER_SECONDS = 1
 
 
 class CircuitState(Enum):
@@ -29,6 +43,29 @@ class CircuitBreaker:
     preventing cascading failures and giving the service time to recover.
     """
 
+    __slots__ = (
+        "name",
+        "failure_threshold",
+        "recovery_timeout",
+        "expected_exception",
+        "half_open_max_calls",
+        "_open_error_msg",
+        "_half_open_error_msg",
+        "failure_window_seconds",
+        "backoff_factor",
+        "max_recovery_timeout",
+        "_current_recovery_timeout",
+        "_reset_after",
+        "_failure_times",
+        "failure_count",
+        "_last_failure_epoch",
+        "_last_failure_monotonic",
+        "state",
+        "half_open_calls",
+        "success_count",
+        "total_calls",
+    )
+
     def __init__(
         self,
         name: str = "circuit_breaker",
@@ -36,24 +73,52 @@ class CircuitBreaker:
         recovery_timeout: int = 60,
         expected_exception: type = Exception,
         half_open_max_calls: int = 1,
+        failure_window_seconds: float = 60.0,
+        backoff_factor: float = 2.0,
+        max_recovery_timeout: Optional[float] = None,
     ):
         """Initialize circuit breaker.
 
         Args:
             name: Name for this circuit breaker (for logging)
             failure_threshold: Number of failures before opening circuit
-            recovery_timeout: Seconds to wait before attempting recovery
+            recovery_timeout: Base seconds to wait before attempting recovery
             expected_exception: Exception type to count as failure
             half_open_max_calls: Max calls allowed in half-open state
+            failure_window_seconds: Only failures within this many seconds
+                count towards failure_threshold
+            backoff_factor: Multiplier applied to the recovery wait each time
+                a half-open probe fails
+            max_recovery_timeout: Cap on the backed-off recovery wait
+                (defaults to 10x recovery_timeout)
         """
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exception = expected_exception
         self.half_open_max_calls = half_open_max_calls
-
+        # Rejection messages, formatted once rather than on every rejected call
+        self._open_error_msg = f"Circuit breaker '{name}' is OPEN"
+        self._half_open_error_msg = f"Circuit breaker '{name}' half-open limit reached"
+        self.failure_window_seconds = failure_window_seconds
+        self.backoff_factor = backoff_factor
+        self.max_recovery_timeout = (
+            max_recovery_timeout if max_recovery_timeout is not None else recovery_timeout * 10
+        )
+        # Recovery wait for the current outage, grown on each failed probe,
+        # and the jittered wait drawn from it when the circuit last opened
+        self._current_recovery_timeout: float = recovery_timeout
+        self._reset_after: float = recovery_timeout
+
+        # Failures within the sliding window (monotonic times, oldest first);
+        # failure_count mirrors its length
+        self._failure_times: deque[float] = deque()
         self.failure_count = 0
-        self.last_failure_time: Optional[datetime] = None
+        # Wall-clock epoch of the last failure, for status reporting only
+        # (formatted on demand); recovery timing uses the monotonic clock so
+        # clock jumps can't wedge the breaker open or reopen it early
+        self._last_failure_epoch: Optional[float] = None
+        self._last_failure_monotonic: Optional[float] = None
         self.state = CircuitState.CLOSED
         self.half_open_calls = 0
         self.success_count = 0
@@ -76,35 +141,57 @@ class CircuitBreaker:
             Result of func
 
         Raises:
-            Exception: If circuit is open
+            CircuitOpenError: If circuit is open or the half-open limit is reached
             expected_exception: If func fails
         """
         self.total_calls += 1
+        state = self.state
+
+        # Fast path: the circuit is almost always closed
+        if state is CircuitState.CLOSED:
+            try:
+                result = await func(*args, **kwargs)
+            except self.expected_exception:
+                self._on_failure()
+                raise
+            if self.state is CircuitState.CLOSED:
+                self.success_count += 1
+                if self.failure_count:
+                    self.failure_count = 0
+                    self._failure_times.clear()
+            else:
+                self._on_success()
+            return result
 
-        if self.state == CircuitState.OPEN:
+        if state is CircuitState.OPEN:
             if self._should_attempt_reset():
                 self._transition_to_half_open()
             else:
-                logger.warning(
-                    "Circuit breaker is OPEN",
-                    name=self.name,
-                    failure_count=self.failure_count,
-                    last_failure=self.last_failure_time.isoformat()
-                    if self.last_failure_time
-                    else None,
+                if _stdlib_logger.isEnabledFor(logging.WARNING):
+                    logger.warning(
+                        "Circuit breaker is OPEN",
+                        name=self.name,
+                        failure_count=self.failure_count,
+                        last_failure=self._last_failure_iso(),
+                    )
+                remaining = self._reset_after
+                if self._last_failure_monotonic is not None:
+                    remaining -= time.monotonic() - self._last_failure_monotonic
+                raise CircuitOpenError(
+                    self._open_error_msg, retry_after=max(1, math.ceil(remaining))
                 )
-                raise Exception(f"Circuit breaker '{self.name}' is OPEN")
 
-        if self.state == CircuitState.HALF_OPEN:
+        if self.state is CircuitState.HALF_OPEN:
             if self.half_open_calls >= self.half_open_max_calls:
-                logger.debug(
-                    "Circuit breaker half-open limit reached",
-                    name=self.name,
-                    calls=self.half_open_calls,
-                    limit=self.half_open_max_calls,
-                )
-                raise Exception(
-                    f"Circuit breaker '{self.name}' half-open limit reached"
+                if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Circuit breaker half-open limit reached",
+                        name=self.name,
+                        calls=self.half_open_calls,
+                        limit=self.half_open_max_calls,
+                    )
+                raise CircuitOpenError(
+                    self._half_open_error_msg, retry_after=HALF_OPEN_RETRY_AFTER_SECONDS
                 )
             self.half_open_calls += 1
 
@@ -113,7 +200,7 @@ class CircuitBreaker:
             self._on_success()
             return result
 
-        except self.expected_exception as e:
+        except self.expected_exception:
             self._on_failure()
             raise
 
@@ -131,17 +218,32 @@ class CircuitBreaker:
         else:
             # In CLOSED state, reset failure count on success
             self.failure_count = 0
+            self._failure_times.clear()
 
     def _on_failure(self):
         """Handle failed call."""
-        self.failure_count += 1
-        self.last_failure_time = datetime.utcnow()
+        now = time.monotonic()
+        failure_times = self._failure_times
+        failure_times.append(now)
+        # Drop failures that have aged out of the window
+        cutoff = now - self.failure_window_seconds
+        while failure_times[0] < cutoff:
+            failure_times.popleft()
+        self.failure_count = len(failure_times)
+        self._last_failure_epoch = time.time()
+        self._last_failure_monotonic = now
 
         if self.state == CircuitState.HALF_OPEN:
+            # Back off further while the service keeps failing probes
+            self._current_recovery_timeout = min(
+                self.max_recovery_timeout,
+                self._current_recovery_timeout * self.backoff_factor,
+            )
             logger.warning(
                 "Circuit breaker recovery failed, reopening",
                 name=self.name,
                 failure_count=self.failure_count,
+                recovery_timeout=self._current_recovery_timeout,
             )
             self._transition_to_open()
 
@@ -158,6 +260,8 @@ class CircuitBreaker:
         """Transition to OPEN state."""
         self.state = CircuitState.OPEN
         self.half_open_calls = 0
+        # Jitter the wait so workers sharing a provider don't probe in lockstep
+        self._reset_after = self._current_recovery_timeout * random.uniform(1.0, 1.5)
 
     def _transition_to_half_open(self):
         """Transition to HALF_OPEN state."""
@@ -180,20 +284,44 @@ class CircuitBreaker:
         )
         self.state = CircuitState.CLOSED
         self.failure_count = 0
+        self._failure_times.clear()
         self.half_open_calls = 0
-        self.last_failure_time = None
+        self._current_recovery_timeout = self.recovery_timeout
+        self._last_failure_epoch = None
+        self._last_failure_monotonic = None
 
     def _should_attempt_reset(self) -> bool:
         """Check if enough time has passed to attempt reset.
 
         Returns:
-            True if recovery timeout has passed
+            True if the (backed-off, jittered) recovery timeout has passed
         """
-        if not self.last_failure_time:
-            return False
+        return (
+            self._last_failure_monotonic is not None
+            and time.monotonic() - self._last_failure_monotonic >= self._reset_after
+        )
 
-        elapsed = (datetime.utcnow() - self.last_failure_time).total_seconds()
-        return elapsed >= self.recovery_timeout
+    @property
+    def last_failure_time(self) -> Optional[datetime]:
+        """Wall-clock time (UTC) of the last recorded failure, if any."""
+        if self._last_failure_epoch is None:
+            return None
+        return datetime.fromtimestamp(self._last_failure_epoch, tz=timezone.utc)
+
+    @last_failure_time.setter
+    def last_failure_time(self, value: Optional[datetime]) -> None:
+        if value is None:
+            self._last_failure_epoch = None
+            return
+        if value.tzinfo is None:
+            # Naive datetimes are taken to be UTC
+            value = value.replace(tzinfo=timezone.utc)
+        self._last_failure_epoch = value.timestamp()
+
+    def _last_failure_iso(self) -> Optional[str]:
+        """Format the last failure time as ISO 8601, or None if unset."""
+        last_failure_time = self.last_failure_time
+        return last_failure_time.isoformat() if last_failure_time else None
 
     @property
     def is_open(self) -> bool:
@@ -217,9 +345,7 @@ class CircuitBreaker:
             "failure_count": self.failure_count,
             "success_count": self.success_count,
             "total_calls": self.total_calls,
-            "last_failure": self.last_failure_time.isoformat()
-            if self.last_failure_time
-            else None,
+            "last_failure": self._last_failure_iso(),
             "threshold": self.failure_threshold,
             "recovery_timeout": self.recovery_timeout,
         }
\ No newline at end of file
@@ -7,12 +7,27 @@ Error classification follows these rules:
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, ClassVar
+
+# Shared read-only details for errors raised without any, so a bare
+# RateLimitError() (or any error without details) allocates no dict
+_EMPTY_DETAILS: Mapping[str, Any] = MappingProxyType({})
 
 
 class IntegrationError(Exception):
     """Base exception for all integration errors."""
 
+    # Whether this error class should be retried; overridden by RetriableError
+    retriable: ClassVar[bool] = False
+    # Class-constant part of to_dict(), rebuilt for each subclass
+    _dict_base: ClassVar[dict[str, Any]] = {"type": "IntegrationError", "retriable": False}
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dict_base = {"type": cls.__name__, "retriable": cls.retriable}
+
     def __init__(
         self,
         message: str,
@@ -23,17 +38,16 @@ class IntegrationError(Exception):
         super().__init__(message)
         self.message = message
         self.category = category
-        self.details = details or {}
+        # Read-only when empty; errors with details own a regular dict
+        self.details: Mapping[str, Any] = details or _EMPTY_DETAILS
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary for serialization."""
-        return {
-            "type": self.__class__.__name__,
-            "message": self.message,
-            "retriable": isinstance(self, RetriableError),
-            "category": self.category,
-            "details": self.details,
-        }
+        result = self._dict_base.copy()
+        result["message"] = self.message
+        result["category"] = self.category
+        result["details"] = {} if self.details is _EMPTY_DETAILS else self.details
+        return result
 
 
 class RetriableError(IntegrationError):
@@ -46,6 +60,8 @@ class RetriableError(IntegrationError):
     - Transient service unavailability
     """
 
+    retriable: ClassVar[bool] = True
+
     def __init__(
         self,
         message: str,
@@ -58,6 +74,27 @@ class RetriableError(IntegrationError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(RetriableError):
+    """Call rejected because a circuit breaker is open or probing recovery.
+
+    The provider was not called; retry after retry_after seconds.
+    """
+
+    def __init__(
+        self,
+        message: str = "Circuit breaker is OPEN",
+        *,
+        retry_after: int | None = None,
+        details: dict[str, Any] | None = None,
+    ) -> None:
+        super().__init__(
+            message,
+            category="circuit_open",
+            details=details,
+            retry_after=retry_after,
+        )
+
+
 class TerminalError(IntegrationError):
     """Permanent failure that should NOT be retried.
 
@@ -94,8 +131,9 @@ class RateLimitError(RetriableError):
         remaining_quota: int | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
-        details = details or {}
+        # Only materialize a details dict when there is something to put in it
         if remaining_quota is not None:
+            details = details or {}
             details["remaining_quota"] = remaining_quota
         super().__init__(
             message,
@@ -115,8 +153,8 @@ class ValidationError(TerminalError):
         field: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
-        details = details or {}
         if field:
+            details = details or {}
             details["field"] = field
         super().__init__(message, category="validation", details=details)
 
@@ -161,8 +199,8 @@ class ConfigurationError(TerminalError):
         config_key: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
-        details = details or {}
         if config_key:
+            details = details or {}
             details["config_key"] = config_key
         super().__init__(message, category="configuration", details=details)
 
@@ -181,11 +219,12 @@ class ResourceNotFoundError(TerminalError):
         resource_id: str | None = None,
         details: dict[str, Any] | None = None,
     ) -> None:
-        details = details or {}
-        if resource_type:
-            details["resource_type"] = resource_type
-        if resource_id:
-            details["resource_id"] = resource_id
+        if resource_type or resource_id:
+            details = details or {}
+            if resource_type:
+                details["resource_type"] = resource_type
+            if resource_id:
+                details["resource_id"] = resource_id
         super().__init__(message, category="not_found", details=details)
 
 
@@ -5,28 +5,100 @@ Provides exponential backoff and rate limit handling for API requests.
 
 import asyncio
 import logging
+import math
 import random
-from typing import Optional, TypeVar, Callable, Any
+import sys
+import weakref
+from contextvars import ContextVar
+from typing import Literal, Optional, TypeVar, Callable, Any
 from functools import wraps
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Longest table of precomputed backoff delays; slower-growing backoffs that
+# take more attempts to reach max_delay compute delays on demand instead
+MAX_DELAY_TABLE_SIZE = 64
+
+# Waits shorter than this are skipped rather than paying an event-loop
+# round-trip for them; the limiter still accounts for the time owed
+MIN_SLEEP_SECONDS = 1e-3
+
+# Retry-After sleeps ending within the same window of this many seconds share
+# one event-loop timer
+SHARED_WAKEUP_GRANULARITY = 0.25
+
+# Pending shared wakeups, keyed by (loop, window index)
+_shared_wakeups: dict[tuple[asyncio.AbstractEventLoop, int], asyncio.Event] = {}
+
+
+def _fire_shared_wakeup(key: tuple[asyncio.AbstractEventLoop, int]) -> None:
+    """Wake every task waiting on a shared wakeup and forget it."""
+    _shared_wakeups.pop(key).set()
+
+
+async def _shared_sleep(delay: float) -> None:
+    """Sleep for at least delay seconds, sharing a timer with concurrent sleepers.
+
+    When many tasks are rate limited together they are told to wait the same
+    Retry-After. Rather than scheduling one timer each, sleeps that end in the
+    same SHARED_WAKEUP_GRANULARITY window wait on a single Event set by one
+    call_at, scheduled for the first sleeper's deadline. A task joining that
+    wakeup may sleep up to one window longer than asked; if it is woken before
+    its own deadline it sleeps off the remainder, unless that is below
+    MIN_SLEEP_SECONDS (the common case for tasks rate limited together).
+
+    Args:
+        delay: Minimum seconds to sleep
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + delay
+    key = (loop, int(deadline // SHARED_WAKEUP_GRANULARITY))
+    event = _shared_wakeups.get(key)
+    if event is None:
+        event = _shared_wakeups[key] = asyncio.Event()
+        loop.call_at(deadline, _fire_shared_wakeup, key)
+    await event.wait()
+
+    remaining = deadline - loop.time()
+    if remaining >= MIN_SLEEP_SECONDS:
+        await asyncio.sleep(remaining)
+
 
 class ExponentialBackoff:
     """Configurable exponential backoff implementation.
 
     Used for handling rate limits and transient failures with the Google Drive API.
     Follows best practices for API retry strategies.
+
+    Each instance draws jitter from its own random.Random (seeded from
+    os.urandom), so concurrent backoffs don't share the module-level
+    generator; call ``backoff._rng.seed(...)`` for reproducible delays.
     """
 
+    __slots__ = (
+        "base_delay",
+        "max_delay",
+        "multiplier",
+        "jitter",
+        "jitter_mode",
+        "_decorrelated",
+        "_attempt",
+        "_prev_delay",
+        "_rng",
+        "_is_binary",
+        "_cap_attempt",
+        "_delays",
+    )
+
     def __init__(
         self,
         base_delay: float = 1.0,
         max_delay: float = 60.0,
         multiplier: float = 2.0,
         jitter: bool = True,
+        jitter_mode: Literal["full", "decorrelated"] = "full",
     ):
         """Initialize exponential backoff configuration.
 
@@ -34,17 +106,68 @@ class ExponentialBackoff:
             base_delay: Initial delay in seconds
             max_delay: Maximum delay in seconds
             multiplier: Multiplier for each retry (e.g., 2.0 for doubling)
-            jitter: Whether to add random jitter to prevent thundering herd
+            jitter: Whether to randomize delays to prevent thundering herd
+            jitter_mode: How delays are randomized when jitter is enabled.
+                "full" draws uniformly between 0 and the exponential delay;
+                "decorrelated" draws between base_delay and 3x the previous
+                delay (capped at max_delay), ignoring multiplier
+
+        Raises:
+            ValueError: If jitter_mode is not recognized
         """
+        if jitter_mode not in ("full", "decorrelated"):
+            raise ValueError(f"Unknown jitter_mode: {jitter_mode!r}")
         self.base_delay = base_delay
         self.max_delay = max_delay
         self.multiplier = multiplier
         self.jitter = jitter
+        self.jitter_mode = jitter_mode
+        self._decorrelated = jitter and jitter_mode == "decorrelated"
         self._attempt = 0
+        # Last delay handed out, which decorrelated jitter grows from
+        self._prev_delay = base_delay
+        self._rng = random.Random()
+        # Doubling backoff (the common case) can use ldexp instead of float
+        # exponentiation
+        self._is_binary = multiplier == 2.0
+        # First attempt whose exponential delay reaches max_delay; later
+        # attempts short-circuit to max_delay without computing the power
+        if multiplier > 1 and 0 < base_delay < max_delay:
+            self._cap_attempt = math.ceil(math.log(max_delay / base_delay, multiplier))
+        else:
+            self._cap_attempt = 0 if base_delay >= max_delay else sys.maxsize
+        # Un-jittered delay for each attempt below the cap, so the common
+        # path is a tuple index
+        if self._cap_attempt <= MAX_DELAY_TABLE_SIZE:
+            self._delays = tuple(
+                self._exponential_delay(attempt) for attempt in range(self._cap_attempt)
+            )
+        else:
+            self._delays = ()
 
     def reset(self) -> None:
         """Reset the backoff counter to initial state."""
         self._attempt = 0
+        self._prev_delay = self.base_delay
+
+    def _capped_delay(self, attempt: int) -> float:
+        """Exponential delay for an attempt, capped at max_delay (no jitter)."""
+        delays = self._delays
+        if attempt < len(delays):
+            return delays[attempt]
+        if attempt >= self._cap_attempt:
+            return self.max_delay
+        return self._exponential_delay(attempt)
+
+    def _exponential_delay(self, attempt: int) -> float:
+        """Compute base_delay * multiplier**attempt, clamped to max_delay."""
+        if self._is_binary:
+            # base * 2**attempt by adjusting the float exponent directly
+            delay = math.ldexp(self.base_delay, attempt)
+        else:
+            delay = self.base_delay * self.multiplier ** attempt
+        # Below the cap attempt this only guards against log() rounding
+        return delay if delay < self.max_delay else self.max_delay
 
     def next_delay(self) -> float:
         """Calculate the next delay based on attempt count.
@@ -52,25 +175,26 @@ class ExponentialBackoff:
         Returns:
             Delay in seconds for the next retry
         """
-        # Calculate exponential delay
-        delay = min(
-            self.base_delay * (self.multiplier ** self._attempt),
-            self.max_delay
-        )
+        if self._decorrelated:
+            # Decorrelated jitter: each delay is drawn relative to the last
+            delay = self._rng.uniform(self.base_delay, self._prev_delay * 3)
+            if delay > self.max_delay:
+                delay = self.max_delay
+            self._prev_delay = delay
+        else:
+            delay = self._capped_delay(self._attempt)
 
-        # Add jitter if enabled (±25% random variation)
-        if self.jitter:
-            jitter_range = delay * 0.25
-            delay = delay + random.uniform(-jitter_range, jitter_range)
-            delay = max(0, delay)  # Ensure non-negative
+            # Full jitter: spread retries uniformly over [0, delay] so clients
+            # that failed together don't retry together, even at the cap
+            if self.jitter:
+                delay = self._rng.random() * delay
 
         self._attempt += 1
 
-        logger.debug(
-            "Calculated backoff delay",
-            attempt=self._attempt,
-            delay_seconds=round(delay, 2),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Calculated backoff delay attempt=%d delay=%.2fs", self._attempt, delay
+            )
 
         return delay
 
@@ -80,33 +204,43 @@ class ExponentialBackoff:
         This is an async method that sleeps for the calculated delay.
         """
         delay = self.next_delay()
-        logger.info(
-            f"Backing off for {delay:.2f} seconds",
-            attempt=self._attempt,
-        )
+        logger.info("Backing off for %.2f seconds attempt=%d", delay, self._attempt)
         await asyncio.sleep(delay)
 
     def get_delay_for_attempt(self, attempt: int) -> float:
         """Calculate delay for a specific attempt number without changing state.
 
+        Decorrelated jitter depends on the previous delay, which a single
+        attempt number doesn't carry, so this always applies full jitter.
+
         Args:
             attempt: The attempt number (0-based)
 
         Returns:
             Delay in seconds for that attempt
         """
-        delay = min(
-            self.base_delay * (self.multiplier ** attempt),
-            self.max_delay
-        )
+        delay = self._capped_delay(attempt)
 
         if self.jitter:
-            jitter_range = delay * 0.25
-            delay = delay + random.uniform(-jitter_range, jitter_range)
-            delay = max(0, delay)
+            delay = self._rng.random() * delay
 
         return delay
 
+    def spread(self, delay: float) -> float:
+        """Randomize a fixed delay over 0.5x-1.5x with this backoff's generator.
+
+        For waits that don't follow the backoff schedule (such as a default
+        Retry-After), so callers that were rate limited together don't all
+        come back together.
+
+        Args:
+            delay: Delay in seconds to randomize
+
+        Returns:
+            Delay in seconds between 0.5 * delay and 1.5 * delay
+        """
+        return self._rng.uniform(delay * 0.5, delay * 1.5)
+
 
 class RateLimitHandler:
     """Handle rate limits with respect for Retry-After headers.
@@ -114,8 +248,14 @@ class RateLimitHandler:
     This class manages rate limit responses from the Google Drive API,
     respecting Retry-After headers and applying exponential backoff
     when the header is not present.
+
+    Retry-After waits on one handler share a deadline: a task told to wait
+    while another is already waiting longer waits for the later of the two,
+    so concurrent rate limits resume together instead of re-probing early.
     """
 
+    __slots__ = ("default_retry_after", "backoff", "_pending_deadline")
+
     def __init__(
         self,
         default_retry_after: int = 60,
@@ -133,6 +273,8 @@ class RateLimitHandler:
             max_delay=120.0,
             multiplier=2.0,
         )
+        # Loop time at which the latest Retry-After wait ends
+        self._pending_deadline = 0.0
 
     async def handle_rate_limit(
         self,
@@ -146,42 +288,77 @@ class RateLimitHandler:
             use_backoff: Whether to use exponential backoff if no retry_after
         """
         if retry_after is not None:
-            # Respect the Retry-After header
-            logger.info(
-                f"Rate limited - waiting {retry_after} seconds as requested",
-                retry_after=retry_after,
-            )
-            await asyncio.sleep(retry_after)
+            # Respect the Retry-After header (Retry-After: 0 means retry now)
+            if retry_after > 0:
+                # No await between reading and updating the deadline, so
+                # concurrent tasks on this loop can't interleave here
+                now = asyncio.get_running_loop().time()
+                deadline = max(self._pending_deadline, now + retry_after)
+                self._pending_deadline = deadline
+                logger.info("Rate limited - waiting %s seconds as requested", retry_after)
+                await _shared_sleep(deadline - now)
             # Reset backoff since we got explicit guidance
             self.backoff.reset()
         elif use_backoff:
             # Use exponential backoff
             await self.backoff.wait()
         else:
-            # Use default wait time
+            # Use the default wait, jittered like the backoff's own delays
+            delay = self.backoff.spread(self.default_retry_after)
             logger.info(
-                f"Rate limited - waiting default {self.default_retry_after} seconds",
-                default_retry_after=self.default_retry_after,
+                "Rate limited - waiting %.2f seconds (default %s)",
+                delay,
+                self.default_retry_after,
             )
-            await asyncio.sleep(self.default_retry_after)
+            await asyncio.sleep(delay)
 
     def reset(self) -> None:
         """Reset the rate limit handler state."""
         self.backoff.reset()
 
 
+class _SharedRetryState:
+    """Retry handler shared by nested with_rate_limit_retry calls.
+
+    Installed by the outermost decorated call so the handler can still be
+    created lazily, on the first rate limit anywhere beneath it, with that
+    outermost call's backoff.
+    """
+
+    __slots__ = ("backoff", "handler")
+
+    def __init__(self, backoff: Optional[ExponentialBackoff]):
+        self.backoff = backoff
+        self.handler: Optional[RateLimitHandler] = None
+
+
+_shared_retry_state: ContextVar[Optional[_SharedRetryState]] = ContextVar(
+    "rate_limit_retry_state", default=None
+)
+
+
 def with_rate_limit_retry(
     max_attempts: int = 3,
     backoff: Optional[ExponentialBackoff] = None,
+    max_concurrency: Optional[int] = None,
 ):
     """Decorator for adding rate limit retry logic to async functions.
 
     This decorator catches RateLimitError exceptions and automatically
     retries with appropriate backoff.
 
+    Decorated calls made from within another decorated call (including tasks
+    it spawns) share the outermost call's RateLimitHandler, so nested retries
+    continue one backoff sequence rather than each restarting their own,
+    using the outermost call's backoff.
+
     Args:
         max_attempts: Maximum number of attempts including the initial call
         backoff: Optional ExponentialBackoff configuration
+        max_concurrency: Optional cap on calls in flight, shared by every
+            invocation of the decorated function on the same event loop. A
+            call holds its slot through its retries, so rate-limited calls
+            don't let new ones in
 
     Example:
         @with_rate_limit_retry(max_attempts=5)
@@ -192,43 +369,71 @@ def with_rate_limit_retry(
     from ..utils.errors import RateLimitError
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        @wraps(func)
         async def wrapper(*args, **kwargs):
-            handler = RateLimitHandler(backoff=backoff)
-            last_error = None
-
-            for attempt in range(max_attempts):
-                try:
-                    # Reset handler if this is a retry after success
-                    if attempt == 0:
-                        handler.reset()
-
-                    result = await func(*args, **kwargs)
-                    return result
-
-                except RateLimitError as e:
-                    last_error = e
-                    if attempt < max_attempts - 1:
+            state = _shared_retry_state.get()
+            token = None
+            if state is None:
+                # Outermost call; the handler is built on the first rate
+                # limit only, since most calls never need it
+                state = _SharedRetryState(backoff)
+                token = _shared_retry_state.set(state)
+
+            try:
+                # Every attempt but the last retries on a rate limit
+                for attempt in range(max_attempts - 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except RateLimitError as e:
+                        handler = state.handler
+                        if handler is None:
+                            handler = state.handler = RateLimitHandler(backoff=state.backoff)
+                            # A shared backoff starts each call from attempt 0
+                            handler.reset()
                         logger.warning(
-                            f"Rate limit hit in {func.__name__}, attempt {attempt + 1}/{max_attempts}, retry_after=%s",
+                            "Rate limit hit in %s, attempt %d/%d, retry_after=%s",
+                            func.__name__,
+                            attempt + 1,
+                            max_attempts,
                             e.retry_after,
                         )
                         await handler.handle_rate_limit(
                             retry_after=e.retry_after,
                             use_backoff=e.retry_after is None,
                         )
-                    else:
-                        logger.error(
-                            f"Rate limit exhausted after {max_attempts} attempts in {func.__name__}",
-                        )
-                        raise
 
-            # Should not reach here, but handle gracefully
-            if last_error:
-                raise last_error
-            raise RuntimeError(f"Unexpected retry loop exit in {func.__name__}")
+                try:
+                    return await func(*args, **kwargs)
+                except RateLimitError:
+                    logger.error(
+                        "Rate limit exhausted after %d attempts in %s",
+                        max_attempts,
+                        func.__name__,
+                    )
+                    raise
+            finally:
+                if token is not None:
+                    _shared_retry_state.reset(token)
+
+        if max_concurrency is None:
+            return wraps(func)(wrapper)
+
+        # One semaphore per event loop, created on first use: a semaphore
+        # binds to the loop it first waits on, and decoration usually happens
+        # at import time, before any loop is running
+        semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
 
-        return wrapper
+        @wraps(func)
+        async def limited_wrapper(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            semaphore = semaphores.get(loop)
+            if semaphore is None:
+                semaphore = semaphores[loop] = asyncio.Semaphore(max_concurrency)
+            async with semaphore:
+                return await wrapper(*args, **kwargs)
+
+        return limited_wrapper
     return decorator
 
 
@@ -237,8 +442,23 @@ class AdaptiveRateLimiter:
 
     This class tracks successful requests and rate limit responses
     to adaptively adjust request rates and prevent hitting limits.
+
+    Requests are paced with a token bucket that refills at current_rate and
+    holds up to one second's worth of tokens (at least one), so a caller that
+    has been idle proceeds immediately while bursts are spaced at the rate.
     """
 
+    __slots__ = (
+        "current_rate",
+        "min_rate",
+        "max_rate",
+        "decrease_factor",
+        "increase_factor",
+        "_tokens",
+        "_last_refill",
+        "_locks",
+    )
+
     def __init__(
         self,
         initial_rate: float = 10.0,  # requests per second
@@ -261,7 +481,16 @@ class AdaptiveRateLimiter:
         self.max_rate = max_rate
         self.decrease_factor = decrease_factor
         self.increase_factor = increase_factor
-        self._last_request_time = 0.0
+        # Token bucket state; the bucket starts full on first acquire
+        self._tokens = 0.0
+        self._last_refill: Optional[float] = None
+        # Serialize acquirers so concurrent callers can't spend the same token.
+        # One lock per event loop, created on first acquire: a lock binds to
+        # the loop it first waits on, and limiters are often built before any
+        # loop is running
+        self._locks: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, asyncio.Lock
+        ] = weakref.WeakKeyDictionary()
 
     def get_delay(self) -> float:
         """Calculate delay needed before next request.
@@ -276,36 +505,66 @@ class AdaptiveRateLimiter:
         return interval
 
     async def acquire(self) -> None:
-        """Wait if necessary to respect rate limit."""
-        delay = self.get_delay()
-        if delay > 0:
-            await asyncio.sleep(delay)
+        """Take a token from the bucket, waiting for one to refill if empty."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        async with lock:
+            now = loop.time()
+            capacity = max(1.0, self.current_rate)
+            if self._last_refill is None:
+                self._tokens = capacity
+            else:
+                self._tokens = min(
+                    capacity,
+                    self._tokens + (now - self._last_refill) * self.current_rate,
+                )
+            self._last_refill = now
+
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return
+
+            # Sleep until the missing fraction of a token has refilled, then
+            # spend it; the refill clock moves to when that happened
+            wait = (1.0 - self._tokens) * self.get_delay()
+            if wait >= MIN_SLEEP_SECONDS:
+                await asyncio.sleep(wait)
+            self._tokens = 0.0
+            self._last_refill = now + wait
 
     def record_success(self) -> None:
         """Record a successful request and potentially increase rate."""
+        # Steady state: already at the ceiling, nothing to compute or log
+        if self.current_rate >= self.max_rate:
+            return
         new_rate = min(
             self.current_rate * self.increase_factor,
             self.max_rate
         )
         if new_rate != self.current_rate:
-            logger.debug(
-                "Increasing request rate after success",
-                old_rate=round(self.current_rate, 2),
-                new_rate=round(new_rate, 2),
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Increasing request rate after success old_rate=%.2f new_rate=%.2f",
+                    self.current_rate,
+                    new_rate,
+                )
             self.current_rate = new_rate
 
     def record_rate_limit(self) -> None:
         """Record a rate limit response and decrease rate."""
+        if self.current_rate <= self.min_rate:
+            return
         new_rate = max(
             self.current_rate * self.decrease_factor,
             self.min_rate
         )
         if new_rate != self.current_rate:
             logger.info(
-                "Decreasing request rate after rate limit",
-                old_rate=round(self.current_rate, 2),
-                new_rate=round(new_rate, 2),
+                "Decreasing request rate after rate limit old_rate=%.2f new_rate=%.2f",
+                self.current_rate,
+                new_rate,
             )
             self.current_rate = new_rate
 
@@ -320,7 +579,4 @@ class AdaptiveRateLimiter:
         else:
             self.current_rate = 10.0  # Default initial rate
 
-        logger.info(
-            "Rate limiter reset",
-            new_rate=round(self.current_rate, 2),
-        )
\ No newline at end of file
+        logger.info("Rate limiter reset new_rate=%.2f", self.current_rate)
\ No newline at end of file
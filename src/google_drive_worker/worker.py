@@ -8,19 +8,22 @@ This module contains the core worker logic that:
 """
 
 import asyncio
-import json
 import logging
 import signal
 import sys
 import time
-from typing import Any, Dict, List, Optional, Set
-from datetime import datetime
+from collections import deque
+from typing import Any, Deque, Dict, List, Mapping, Optional, Set, Tuple
+from datetime import datetime, timezone
 from contextlib import asynccontextmanager
+import orjson
 import structlog
+from cachetools import TTLCache
 from tenacity import (
+    RetryCallState,
     retry,
     stop_after_attempt,
-    wait_exponential,
+    wait_random_exponential,
     retry_if_exception_type,
     before_sleep_log,
 )
@@ -48,6 +51,34 @@ from .utils.errors import (
     RateLimitError,
 )
 
+# stdlib logger that structlog's LoggerFactory resolves for the worker logger
+# (it is bound in this module); used for cheap level checks on hot paths
+_stdlib_logger = logging.getLogger(__name__)
+
+# Record sends allowed in flight per handler run before the oldest half is
+# awaited; keeps the producer's batches full without unbounded buffering
+MAX_IN_FLIGHT_SENDS = 256
+
+# Longest wait between _process_with_retry attempts, in seconds
+MAX_RETRY_WAIT_SECONDS = 60.0
+
+# Full-jitter exponential wait (uniform in [0, 2 * 2**attempt], capped) so
+# connections throttled together do not retry in lockstep
+_jittered_retry_wait = wait_random_exponential(multiplier=2.0, max=MAX_RETRY_WAIT_SECONDS)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """Wait before retrying _process_with_retry.
+
+    Honors the retry_after of the failed attempt's error (set by rate limit
+    errors), up to MAX_RETRY_WAIT_SECONDS, and falls back to jittered
+    exponential backoff.
+    """
+    retry_after = getattr(retry_state.outcome.exception(), "retry_after", None)
+    if retry_after:
+        return min(float(retry_after), MAX_RETRY_WAIT_SECONDS)
+    return _jittered_retry_wait(retry_state)
+
 
 class GoogleDriveWorker:
     """Main worker orchestration for Google Drive integration.
@@ -99,11 +130,35 @@ class GoogleDriveWorker:
             ),
         ]
 
+        # Route tables keyed by JSON-RPC method and legacy action. setdefault
+        # keeps the first handler listed, matching a scan of self.handlers.
+        self._method_routes: Dict[str, Any] = {}
+        self._action_routes: Dict[str, Any] = {}
+        for h in self.handlers:
+            for supported_method in h.SUPPORTED_METHODS:
+                self._method_routes.setdefault(supported_method, h)
+            for supported_action in h.SUPPORTED_ACTIONS:
+                self._action_routes.setdefault(supported_action, h)
+
         # Capability handler (processes method-based routing, not action-based)
         self.capability_handler = GoogleDriveCapabilityHandler()
 
-        # Concurrency control
+        # Control Plane connection configs keyed by connection ID. Messages for
+        # one connection run serially within a batch, so concurrent misses for
+        # the same key do not occur and no per-key lock is needed.
+        self._connection_config_cache: TTLCache[str, Dict[str, Any]] = TTLCache(
+            maxsize=settings.worker.connection_config_cache_size,
+            ttl=settings.worker.connection_config_cache_ttl_seconds,
+        )
+
+        # Nonces of records whose send has started but not yet completed
+        self._sending_nonces: Set[str] = set()
+
+        # Concurrency control. connections_idle is set whenever
+        # active_connections is empty, so stop() can wait for the drain.
         self.active_connections: Set[str] = set()
+        self.connections_idle = asyncio.Event()
+        self.connections_idle.set()
         self.connection_semaphore = asyncio.Semaphore(
             settings.worker.max_concurrent_connections
         )
@@ -126,6 +181,15 @@ class GoogleDriveWorker:
             "cache_hit_rate": 0.0,
         }
 
+        # Set by message handling when the consumer position should advance;
+        # flushed by _commit_offsets at most once per commit interval
+        self._commit_pending = False
+        self._last_commit = time.monotonic()
+
+        # produced_at header cache, refreshed at most once per millisecond
+        self._produced_at_ms = 0
+        self._produced_at_iso = ""
+
     def _setup_logger(self) -> structlog.BoundLogger:
         """Setup structured logging."""
         import logging
@@ -172,9 +236,11 @@ class GoogleDriveWorker:
 
         self.running = True
 
-        # Setup signal handlers
+        # Setup signal handlers on the loop so the handler runs as a loop
+        # callback and can wake the poll through shutdown_event
+        loop = asyncio.get_running_loop()
         for sig in (signal.SIGTERM, signal.SIGINT):
-            signal.signal(sig, self._handle_shutdown_signal)
+            loop.add_signal_handler(sig, self._handle_shutdown_signal, sig)
 
         try:
             # Start consumer
@@ -198,17 +264,31 @@ class GoogleDriveWorker:
         """Stop the worker gracefully."""
         self.logger.info("Stopping Google Drive worker")
         self.running = False
+        self.shutdown_event.set()
 
-        # Wait for active connections to complete
+        # Wait for active connections to complete, up to the grace period
         if self.active_connections:
             self.logger.info(
                 "Waiting for active connections",
                 count=len(self.active_connections),
             )
-            await asyncio.sleep(5)  # Give time to complete
+            try:
+                await asyncio.wait_for(
+                    self.connections_idle.wait(),
+                    timeout=self.settings.worker.shutdown_grace_seconds,
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(
+                    "Shutdown grace period elapsed with active connections",
+                    count=len(self.active_connections),
+                )
 
         # Close Kafka clients
         if self.consumer:
+            try:
+                await self._commit_offsets(force=True)
+            except Exception as e:
+                self.logger.warning("Final offset commit failed", error=str(e))
             await self.consumer.stop()
             self.logger.info("Kafka consumer stopped")
 
@@ -228,13 +308,20 @@ class GoogleDriveWorker:
             bootstrap_servers=self.settings.kafka.bootstrap_servers,
             consumer_group_id=self.settings.kafka.consumer_group_id,
             auto_offset_reset=self.settings.kafka.auto_offset_reset,
+            # Producer batching: records produced within linger_ms of each
+            # other share one request instead of one request per record
+            linger_ms=self.settings.kafka.linger_ms,
+            max_batch_size=self.settings.kafka.batch_size,
+            compression_type=self.settings.kafka.compression_type,
         )
 
-        # Initialize consumer
+        # Initialize consumer. on_revoke commits pending offsets before
+        # partitions move to another consumer in the group.
         self.consumer = KafkaConsumer(
             config=kafka_config,
             topics=[self.command_topic],
             client_id="google-drive-worker-consumer",
+            on_revoke=self._on_partitions_revoked,
         )
 
         # Initialize producer
@@ -306,93 +393,191 @@ class GoogleDriveWorker:
             )
 
     async def _process_messages(self) -> None:
-        """Main message processing loop."""
+        """Main message processing loop.
+
+        Each poll returns up to WORKER_CONSUMER_BATCH_SIZE messages (default
+        100). Larger polls spread the per-poll overhead over more messages;
+        smaller ones finish sooner, so offsets are committed more often.
+
+        Each poll is raced against shutdown_event, so a shutdown signal ends
+        the loop without waiting out the poll timeout.
+        """
         self.logger.info("Starting message processing loop")
 
-        while self.running:
-            try:
-                # Fetch messages with timeout (toolkit returns List[KafkaMessage])
-                messages = await self.consumer.poll_messages(
-                    max_messages=100,
-                    timeout_ms=1000,
-                )
+        shutdown_wait = asyncio.create_task(self.shutdown_event.wait())
+        try:
+            while self.running:
+                try:
+                    # Fetch messages with timeout (toolkit returns List[KafkaMessage])
+                    poll = asyncio.create_task(
+                        self.consumer.poll_messages(
+                            max_messages=self.settings.worker.consumer_batch_size,
+                            timeout_ms=self.settings.worker.consumer_poll_timeout_ms,
+                        )
+                    )
+                    await asyncio.wait(
+                        {poll, shutdown_wait}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not poll.done():
+                        poll.cancel()
+                        break
 
-                if not messages:
-                    continue
+                    messages = poll.result()
+                    if messages:
+                        await self._process_batch(messages)
+                    await self._commit_offsets()
 
-                # Process each message
-                for message in messages:
-                    await self._process_single_message(message)
+                except asyncio.CancelledError:
+                    self.logger.info("Processing loop cancelled")
+                    break
+                except Exception as e:
+                    self.logger.error(
+                        "Error in processing loop",
+                        error=str(e),
+                        exc_info=True,
+                    )
+                    await asyncio.sleep(1)  # Backoff on error
+        finally:
+            shutdown_wait.cancel()
 
-            except asyncio.CancelledError:
-                self.logger.info("Processing loop cancelled")
-                break
-            except Exception as e:
+    async def _process_batch(self, messages: List[KafkaMessage]) -> None:
+        """Process a polled batch, running different connections concurrently.
+
+        Messages are grouped by connection ID. Groups run concurrently (bounded
+        by connection_semaphore); messages within a group run in poll order, so
+        a connection never has two messages in flight and none is skipped as
+        "already being processed". Offsets are committed after the batch, at
+        most once per commit interval (see _commit_offsets).
+
+        Args:
+            messages: Messages returned by one poll
+        """
+        by_connection: Dict[str, List[Tuple[KafkaMessage, Optional[str]]]] = {}
+        for message in messages:
+            connection_id, integration_id = self._extract_routing(message.value)
+            by_connection.setdefault(connection_id, []).append((message, integration_id))
+
+        results = await asyncio.gather(
+            *(
+                self._process_connection_messages(connection_id, group)
+                for connection_id, group in by_connection.items()
+            ),
+            return_exceptions=True,
+        )
+        for connection_id, result in zip(by_connection, results, strict=True):
+            if isinstance(result, Exception):
                 self.logger.error(
-                    "Error in processing loop",
-                    error=str(e),
-                    exc_info=True,
+                    "Error processing connection batch",
+                    error=str(result),
+                    connection_id=connection_id,
+                    exc_info=result,
                 )
-                await asyncio.sleep(1)  # Backoff on error
 
-    def _extract_connection_id(self, message: dict[str, Any]) -> str:
-        """Extract connection ID from JSON-RPC header or message root.
+    async def _commit_offsets(self, force: bool = False) -> None:
+        """Commit the consumer position if messages were marked for commit.
+
+        Commits happen at most once per WORKER_COMMIT_INTERVAL_SECONDS; the
+        poll loop calls this after every poll (empty or not) so a pending
+        commit is flushed within one poll timeout of the interval elapsing.
 
         Args:
-            message: The message payload
+            force: Commit regardless of the interval (used on shutdown)
+        """
+        if not self._commit_pending:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_commit < self.settings.worker.commit_interval_seconds:
+            return
+        self._commit_pending = False
+        self._last_commit = now
+        await self.consumer.commit()
 
-        Returns:
-            Connection ID string
+    def _on_partitions_revoked(self, consumer: Any, partitions: List[Any]) -> None:
+        """Commit pending offsets before partitions are revoked in a rebalance.
+
+        Called by the Kafka client from within a poll, so every polled message
+        has been processed and the consumer position is safe to commit. Without
+        this, progress held back by the commit interval would be redelivered
+        to the partitions' new owner.
+
+        Args:
+            consumer: Underlying Kafka consumer performing the rebalance
+            partitions: Partitions being revoked
         """
-        # JSON-RPC 2.0 format: params.header.parameters.integration_connection_id
-        if message.get("jsonrpc") == "2.0":
-            params = message.get("params", {})
-            header = params.get("header", {})
-            header_params = header.get("parameters", {})
-            conn_id = header_params.get("integration_connection_id")
-            if conn_id:
-                return conn_id
+        if not self._commit_pending:
+            return
+        try:
+            consumer.commit(asynchronous=False)
+        except Exception as e:
+            self.logger.warning(
+                "Offset commit on partition revoke failed",
+                error=str(e),
+                partitions=len(partitions),
+            )
+            return
+        self._commit_pending = False
+        self._last_commit = time.monotonic()
 
-        # Legacy format: message root
-        return message.get("integration_connection_id", "unknown")
+    async def _process_connection_messages(
+        self,
+        connection_id: str,
+        messages: List[Tuple[KafkaMessage, Optional[str]]],
+    ) -> None:
+        """Process one connection's messages from a batch in order.
+
+        Args:
+            connection_id: Connection ID shared by the messages
+            messages: (message, integration ID) pairs in poll order
+        """
+        for message, integration_id in messages:
+            await self._process_single_message(message, connection_id, integration_id)
+
+    def _extract_routing(self, message: dict[str, Any]) -> Tuple[str, str | None]:
+        """Extract connection and integration IDs from JSON-RPC header or message root.
 
-    def _extract_integration_id(self, message: dict[str, Any]) -> str | None:
-        """Extract integration ID from JSON-RPC header or message root.
+        The JSON-RPC header is walked once for both values.
 
         Args:
             message: The message payload
 
         Returns:
-            Integration ID string or None if not found
+            (connection ID, integration ID or None if not found)
         """
-        # JSON-RPC 2.0 format: params.header.parameters.integration_provider_name
+        conn_id = None
+        provider_name = None
+
+        # JSON-RPC 2.0 format: params.header.parameters.integration_connection_id
+        # and params.header.parameters.integration_provider_name
         if message.get("jsonrpc") == "2.0":
-            params = message.get("params", {})
-            header = params.get("header", {})
-            header_params = header.get("parameters", {})
+            header_params = message.get("params", {}).get("header", {}).get("parameters", {})
+            conn_id = header_params.get("integration_connection_id")
             provider_name = header_params.get("integration_provider_name")
-            if provider_name:
-                return provider_name
 
         # Legacy format: message root
-        return message.get("integration_id")
+        return (
+            conn_id or message.get("integration_connection_id", "unknown"),
+            provider_name or message.get("integration_id"),
+        )
 
-    async def _process_single_message(self, message: KafkaMessage) -> None:
+    async def _process_single_message(
+        self,
+        message: KafkaMessage,
+        connection_id: str,
+        integration_id: Optional[str],
+    ) -> None:
         """Process a single Kafka message.
 
         Args:
             message: Kafka message from consumer (toolkit KafkaMessage)
+            connection_id: Connection ID from _extract_routing
+            integration_id: Integration ID from _extract_routing
         """
         topic = message.topic
         key = message.key
         value = message.value
         headers = message.headers
 
-        # Extract connection ID using helper (supports JSON-RPC 2.0 and legacy)
-        connection_id = self._extract_connection_id(value)
-
         # Check if we should process this message (supports JSON-RPC 2.0 and legacy)
-        integration_id = self._extract_integration_id(value)
         if integration_id and integration_id != self.settings.worker.integration_id:
             # Not for us, skip with logging
             self.logger.debug(
@@ -401,7 +586,7 @@ class GoogleDriveWorker:
                 expected_integration_id=self.settings.worker.integration_id,
                 connection_id=connection_id,
             )
-            await self.consumer.commit()
+            self._commit_pending = True
             return
 
         # Concurrency control per connection
@@ -414,6 +599,7 @@ class GoogleDriveWorker:
                 return
 
             self.active_connections.add(connection_id)
+            self.connections_idle.clear()
             try:
                 await self._handle_message(
                     topic,
@@ -434,11 +620,35 @@ class GoogleDriveWorker:
                 )
             finally:
                 self.active_connections.discard(connection_id)
+                if not self.active_connections:
+                    self.connections_idle.set()
+
+    async def _get_connection_config(
+        self,
+        handler: Any,
+        connection_id: str,
+        refresh: bool = False,
+    ) -> Dict[str, Any]:
+        """Get a connection's configuration, cached for a short TTL.
+
+        Args:
+            handler: Handler used to fetch from the Control Plane on a miss
+            connection_id: Integration connection ID
+            refresh: Bypass the cache and store a freshly fetched config
+
+        Returns:
+            A copy of the connection configuration; callers may modify it
+        """
+        connection_config = None if refresh else self._connection_config_cache.get(connection_id)
+        if connection_config is None:
+            connection_config = await handler.fetch_connection_config(connection_id)
+            self._connection_config_cache[connection_id] = connection_config
+        return dict(connection_config)
 
     @retry(
         retry=retry_if_exception_type(RetriableError),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=2.0, max=60.0),
+        wait=_retry_wait,
         before_sleep=before_sleep_log(structlog.get_logger(), logging.INFO),
     )
     async def _process_with_retry(
@@ -458,12 +668,41 @@ class GoogleDriveWorker:
 
         Returns:
             Number of records produced
+
+        Records are sent without waiting for each delivery, so the handler
+        keeps fetching while earlier sends are batched by the producer. At
+        most MAX_IN_FLIGHT_SENDS are outstanding; every send has completed
+        before this returns, and the first failed send cancels the rest and
+        is re-raised. Nonces are only recorded for delivered records, so a
+        retry re-sends the failed record and every record after it.
         """
         record_count = 0
-        async for record in handler.process_message(message, connection_config):
-            # Plan 35/36: Pass connection_config for snowball extraction
-            await self._produce_record(record, connection_id, connection_config=connection_config)
-            record_count += 1
+        in_flight: Deque[asyncio.Task] = deque()
+        try:
+            async for record in handler.process_message(message, connection_config):
+                # Plan 35/36: Pass connection_config for snowball extraction
+                in_flight.append(
+                    asyncio.create_task(
+                        self._produce_record(
+                            record, connection_id, connection_config=connection_config
+                        )
+                    )
+                )
+                record_count += 1
+                if len(in_flight) >= MAX_IN_FLIGHT_SENDS:
+                    # Drain the oldest half; they were queued first
+                    while len(in_flight) > MAX_IN_FLIGHT_SENDS // 2:
+                        await in_flight.popleft()
+
+            while in_flight:
+                await in_flight.popleft()
+        finally:
+            # On failure, cancel the unsent records and wait for them to
+            # unwind so none is still sending when the run is retried
+            for task in in_flight:
+                task.cancel()
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
         return record_count
 
     async def _handle_message(
@@ -527,12 +766,15 @@ class GoogleDriveWorker:
                 return
 
         try:
-            # Route to handler first so we can use its fetch_connection_config method
-            handler = None
-            for h in self.handlers:
-                if h.can_handle(value):
-                    handler = h
-                    break
+            # Route to handler first so we can use its fetch_connection_config method.
+            # The route tables pick the only candidate; can_handle still applies
+            # the provider/integration checks.
+            if is_jsonrpc and "method" in value:
+                handler = self._method_routes.get(method)
+            else:
+                handler = self._action_routes.get(action)
+            if handler is not None and not handler.can_handle(value):
+                handler = None
 
             if not handler:
                 self.logger.warning(
@@ -542,7 +784,7 @@ class GoogleDriveWorker:
                     method=method,
                     integration_id=value.get("integration_id"),
                 )
-                await self.consumer.commit()
+                self._commit_pending = True
                 return
 
             # Handle "pending_lookup" case for webhooks that don't have connection_id
@@ -568,8 +810,16 @@ class GoogleDriveWorker:
                         value, connection_id
                     )
                 else:
-                    # Fetch connection configuration from Control Plane
-                    connection_config = await handler.fetch_connection_config(connection_id)
+                    # Fetch connection configuration from Control Plane. Init and
+                    # teardown always refetch since they change the connection.
+                    connection_config = await self._get_connection_config(
+                        handler,
+                        connection_id,
+                        refresh=method in (
+                            "clustera.integration.connection.initialize",
+                            "clustera.integration.connection.teardown",
+                        ),
+                    )
 
                     # For init messages, merge metadata from message with Control Plane config
                     if method == "clustera.integration.connection.initialize":
@@ -594,6 +844,9 @@ class GoogleDriveWorker:
                 handler, value, connection_id, connection_config
             )
 
+            if method == "clustera.integration.connection.teardown":
+                self._connection_config_cache.pop(connection_id, None)
+
             # Track processing time
             duration = time.time() - start_time
             self.metrics["processing_time_seconds"] += duration
@@ -605,8 +858,8 @@ class GoogleDriveWorker:
                 processing_time_seconds=duration,
             )
 
-            # Commit offset after successful processing
-            await self.consumer.commit()
+            # Commit offset after successful processing (see _commit_offsets)
+            self._commit_pending = True
 
         except RetriableError as e:
             # Retriable error after all retries exhausted
@@ -628,7 +881,7 @@ class GoogleDriveWorker:
                 connection_id=connection_id,
             )
             await self._produce_error(e, value, connection_id, retriable=False)
-            await self.consumer.commit()  # Skip this message
+            self._commit_pending = True  # Skip this message
             self.metrics["errors_terminal"] += 1
 
         except Exception as e:
@@ -639,7 +892,7 @@ class GoogleDriveWorker:
                 connection_id=connection_id,
             )
             await self._produce_error(e, value, connection_id, retriable=False)
-            await self.consumer.commit()  # Skip this message
+            self._commit_pending = True  # Skip this message
             self.metrics["errors_terminal"] += 1
 
         finally:
@@ -675,6 +928,20 @@ class GoogleDriveWorker:
             response_id=response.get("id"),
         )
 
+    def _produced_at(self) -> str:
+        """Return the produced_at header value (UTC ISO-8601, millisecond precision).
+
+        Records produced within the same millisecond share one formatted string
+        instead of building and formatting a datetime per record.
+        """
+        now_ms = int(time.time() * 1000)
+        if now_ms != self._produced_at_ms:
+            self._produced_at_ms = now_ms
+            self._produced_at_iso = datetime.fromtimestamp(
+                now_ms / 1000, tz=timezone.utc
+            ).replace(tzinfo=None).isoformat(timespec="milliseconds")
+        return self._produced_at_iso
+
     async def _produce_record(
         self,
         record: Dict[str, Any],
@@ -707,20 +974,25 @@ class GoogleDriveWorker:
         nonce = record.get("params", {}).get("nonce", "")
         method = record.get("method", "unknown")
 
-        # Check idempotency cache (atomic check-and-set)
-        if nonce and not self.idempotency_cache.check_and_set(nonce):
-            # Returns False if key already exists (duplicate)
-            self.logger.debug(
-                "Skipping duplicate record",
-                nonce=nonce,
-                method=method,
-                connection_id=connection_id,
-            )
+        # Skip nonces already delivered or currently being sent. The nonce is
+        # only recorded in the idempotency cache once the send succeeds, so a
+        # failed or cancelled send is re-sent when the run is retried.
+        if nonce and (
+            nonce in self._sending_nonces or self.idempotency_cache.contains(nonce)
+        ):
+            if _stdlib_logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Skipping duplicate record",
+                    nonce=nonce,
+                    method=method,
+                    connection_id=connection_id,
+                )
             self.metrics["duplicates_skipped"] += 1
             return
 
-        # Check payload size for S3 offloading
-        payload_size = len(json.dumps(record).encode("utf-8"))
+        # Check payload size for S3 offloading. orjson emits compact UTF-8
+        # bytes directly, so there is no separate encode pass.
+        payload_size = len(orjson.dumps(record))
         if payload_size > self.settings.worker.s3_payload_threshold_bytes:
             # TODO: Implement S3 offloading in next step
             self.logger.warning(
@@ -731,26 +1003,36 @@ class GoogleDriveWorker:
             self.metrics["payloads_offloaded_to_s3"] += 1
 
         # Send record directly - it's already in JSON-RPC 2.0 format from handlers
-        await self.producer.send(
-            topic=self.output_topic,
-            key=connection_id,
-            value=record,
-            headers={
-                "source": self.settings.service_name,
-                "produced_at": datetime.utcnow().isoformat(),
-                "nonce": nonce,
-            },
-        )
+        if nonce:
+            self._sending_nonces.add(nonce)
+        try:
+            await self.producer.send(
+                topic=self.output_topic,
+                key=connection_id,
+                value=record,
+                headers={
+                    "source": self.settings.service_name,
+                    "produced_at": self._produced_at(),
+                    "nonce": nonce,
+                },
+            )
+            if nonce:
+                self.idempotency_cache.check_and_set(nonce)
+        finally:
+            self._sending_nonces.discard(nonce)
 
         self.metrics["records_produced"] += 1
 
-        self.logger.info(
-            "Record produced to Kafka",
-            topic=self.output_topic,
-            connection_id=connection_id,
-            method=method,
-            nonce=nonce[:50] + "..." if len(nonce) > 50 else nonce,
-        )
+        # Per-record detail is debug-only; "Message processed successfully"
+        # reports the record count for the whole run at info
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Record produced to Kafka",
+                topic=self.output_topic,
+                connection_id=connection_id,
+                method=method,
+                nonce=nonce[:50] + "..." if len(nonce) > 50 else nonce,
+            )
 
     async def _produce_error(
         self,
@@ -773,7 +1055,7 @@ class GoogleDriveWorker:
 
         # Extract error details from IntegrationError
         error_category = "unknown"
-        error_details: Dict[str, Any] = {}
+        error_details: Mapping[str, Any] = {}
         if isinstance(error, IntegrationError):
             error_category = error.category
             error_details = error.details
@@ -821,7 +1103,8 @@ class GoogleDriveWorker:
 
         self.metrics["errors_produced"] += 1
 
-    def _handle_shutdown_signal(self, signum: int, frame: Any) -> None:
+    def _handle_shutdown_signal(self, signum: int) -> None:
         """Handle shutdown signals gracefully."""
         self.logger.info(f"Received signal {signum}, initiating shutdown")
-        self.running = False
\ No newline at end of file
+        self.running = False
+        self.shutdown_event.set()
\ No newline at end of file
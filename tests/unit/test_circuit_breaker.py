@@ -1,11 +1,14 @@
 """Unit tests for circuit breaker pattern."""
 
+import pickle
+
 import pytest
 import asyncio
 from datetime import datetime, timedelta
 from unittest.mock import patch, AsyncMock
 
 from google_drive_worker.utils.circuit_breaker import CircuitBreaker, CircuitState
+from google_drive_worker.utils.errors import CircuitOpenError, RetriableError
 
 
 class TestCircuitBreaker:
@@ -99,7 +102,7 @@ class TestCircuitBreaker:
         assert circuit_breaker.state == CircuitState.OPEN
 
         # Mock time to simulate timeout passing
-        with patch.object(circuit_breaker, "_should_attempt_reset", return_value=True):
+        with patch.object(CircuitBreaker, "_should_attempt_reset", return_value=True):
             async def test_func():
                 return "success"
 
@@ -232,4 +235,146 @@ class TestCircuitBreaker:
         # Rest should be rejected due to open circuit
         assert sum(1 for r in results if isinstance(r, Exception) and "is OPEN" in str(r)) >= 1
 
-        assert circuit_breaker.state == CircuitState.OPEN
\ No newline at end of file
+        assert circuit_breaker.state == CircuitState.OPEN
+
+    @pytest.mark.asyncio
+    async def test_recovery_uses_monotonic_clock(self, circuit_breaker):
+        """Test recovery timing follows the monotonic clock, not wall time."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=1000.0), \
+             patch("google_drive_worker.utils.circuit_breaker.random.uniform", return_value=1.0):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await circuit_breaker.call(failing_func)
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=1059.0):
+            assert not circuit_breaker._should_attempt_reset()
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=1060.0):
+            assert circuit_breaker._should_attempt_reset()
+
+    @pytest.mark.asyncio
+    async def test_failures_outside_window_do_not_open(self, circuit_breaker):
+        """Test only failures within the sliding window count towards the threshold."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        # failure_window_seconds defaults to 60; space failures 40s apart
+        for now in (1000.0, 1040.0, 1080.0, 1120.0):
+            with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=now):
+                with pytest.raises(ValueError):
+                    await circuit_breaker.call(failing_func)
+
+        assert circuit_breaker.failure_count == 2
+        assert circuit_breaker.state == CircuitState.CLOSED
+
+    @pytest.mark.asyncio
+    async def test_failed_probe_backs_off_recovery(self, circuit_breaker):
+        """Test each failed half-open probe doubles the recovery wait up to the cap."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        circuit_breaker.max_recovery_timeout = 150
+        for expected in (120, 150):
+            circuit_breaker.state = CircuitState.HALF_OPEN
+            with patch("google_drive_worker.utils.circuit_breaker.random.uniform", return_value=1.0):
+                with pytest.raises(ValueError):
+                    await circuit_breaker.call(failing_func)
+
+            assert circuit_breaker.state == CircuitState.OPEN
+            assert circuit_breaker._reset_after == expected
+
+        circuit_breaker._reset()
+        assert circuit_breaker._current_recovery_timeout == 60
+
+    @pytest.mark.asyncio
+    async def test_recovery_jitter_never_shortens_timeout(self, circuit_breaker):
+        """Test the jittered wait is between 1x and 1.5x the recovery timeout."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        for _ in range(3):
+            with pytest.raises(ValueError):
+                await circuit_breaker.call(failing_func)
+
+        assert 60 <= circuit_breaker._reset_after <= 90
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_raises_circuit_open_error(self, circuit_breaker):
+        """Test rejected calls raise a retriable CircuitOpenError with retry_after."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        with patch("google_drive_worker.utils.circuit_breaker.random.uniform", return_value=1.0):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await circuit_breaker.call(failing_func)
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await circuit_breaker.call(AsyncMock())
+
+        assert isinstance(exc_info.value, RetriableError)
+        assert exc_info.value.category == "circuit_open"
+        assert 0 < exc_info.value.retry_after <= 60
+
+    @pytest.mark.asyncio
+    async def test_half_open_rejection_has_positive_retry_after(self, circuit_breaker):
+        """Test calls rejected while the half-open probe runs get a positive retry_after."""
+        circuit_breaker.state = CircuitState.HALF_OPEN
+        circuit_breaker.half_open_calls = circuit_breaker.half_open_max_calls
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            await circuit_breaker.call(AsyncMock())
+
+        assert exc_info.value.retry_after >= 1
+
+    @pytest.mark.asyncio
+    async def test_open_rejection_rounds_retry_after_up(self, circuit_breaker):
+        """Test a sub-second remaining wait is reported as 1s, not 0."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=1000.0), \
+             patch("google_drive_worker.utils.circuit_breaker.random.uniform", return_value=1.0):
+            for _ in range(3):
+                with pytest.raises(ValueError):
+                    await circuit_breaker.call(failing_func)
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.monotonic", return_value=1059.5):
+            with pytest.raises(CircuitOpenError) as exc_info:
+                await circuit_breaker.call(AsyncMock())
+
+        assert exc_info.value.retry_after == 1
+
+    @pytest.mark.asyncio
+    async def test_slots_and_pickling(self, circuit_breaker):
+        """Test the slotted breaker has no __dict__ and survives a pickle round-trip."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        with pytest.raises(ValueError):
+            await circuit_breaker.call(failing_func)
+
+        assert not hasattr(circuit_breaker, "__dict__")
+
+        restored = pickle.loads(pickle.dumps(circuit_breaker))
+        assert restored.name == "test_breaker"
+        assert restored.state == CircuitState.CLOSED
+        assert restored.failure_count == 1
+        assert list(restored._failure_times) == list(circuit_breaker._failure_times)
+        assert restored.expected_exception is ValueError
+
+    @pytest.mark.asyncio
+    async def test_last_failure_formatted_on_demand(self, circuit_breaker):
+        """Test the failure path records an epoch and get_status formats it in UTC."""
+        async def failing_func():
+            raise ValueError("test error")
+
+        with patch("google_drive_worker.utils.circuit_breaker.time.time", return_value=0.0):
+            with pytest.raises(ValueError):
+                await circuit_breaker.call(failing_func)
+
+        assert circuit_breaker._last_failure_epoch == 0.0
+        assert circuit_breaker.get_status()["last_failure"] == "1970-01-01T00:00:00+00:00"
@@ -654,4 +654,97 @@ class TestGoogleDriveAPIClient:
         # Verify parameters
         request = respx.calls.last.request
         assert "supportsAllDrives=false" in str(request.url)
-        assert "includeItemsFromAllDrives=false" in str(request.url)
\ No newline at end of file
+        assert "includeItemsFromAllDrives=false" in str(request.url)
+
+    # upload_file tests
+
+    @respx.mock
+    async def test_upload_file_multipart(self, api_client):
+        """Test small in-memory uploads use a single multipart request."""
+        route = respx.post("https://www.googleapis.com/upload/drive/v3/files").mock(
+            return_value=httpx.Response(200, json={"id": "new_file", "name": "notes.txt"})
+        )
+
+        result = await api_client.upload_file(
+            {"name": "notes.txt"}, b"hello world", "text/plain"
+        )
+
+        assert result["id"] == "new_file"
+        request = route.calls.last.request
+        assert "uploadType=multipart" in str(request.url)
+        assert request.headers["Content-Type"].startswith("multipart/related; boundary=")
+        body = request.content
+        assert b'{"name": "notes.txt"}' in body
+        assert b"Content-Type: text/plain\r\n\r\nhello world\r\n--" in body
+        assert int(request.headers["Content-Length"]) == len(body)
+
+    @respx.mock
+    async def test_upload_file_resumable(self, api_client):
+        """Test large uploads send the whole content in one resumable request."""
+        api_client.RESUMABLE_THRESHOLD = 2
+        session_url = "https://www.googleapis.com/upload/drive/v3/files?upload_id=abc"
+
+        session_route = respx.post("https://www.googleapis.com/upload/drive/v3/files").mock(
+            return_value=httpx.Response(200, headers={"Location": session_url})
+        )
+        put_route = respx.put(session_url).mock(
+            return_value=httpx.Response(200, json={"id": "big_file"})
+        )
+
+        result = await api_client.upload_file({"name": "big.bin"}, b"abcdefg", "application/octet-stream")
+
+        assert result["id"] == "big_file"
+        assert "uploadType=resumable" in str(session_route.calls.last.request.url)
+        assert put_route.call_count == 1
+        request = put_route.calls.last.request
+        assert request.headers["Content-Range"] == "bytes 0-6/7"
+        assert request.content == b"abcdefg"
+
+    @respx.mock
+    async def test_upload_file_resumable_resumes_from_committed_byte(self, api_client):
+        """Test a partially committed upload is resent from the committed offset."""
+        api_client.RESUMABLE_THRESHOLD = 2
+        session_url = "https://www.googleapis.com/upload/drive/v3/files?upload_id=abc"
+
+        respx.post("https://www.googleapis.com/upload/drive/v3/files").mock(
+            return_value=httpx.Response(200, headers={"Location": session_url})
+        )
+        put_route = respx.put(session_url).mock(
+            side_effect=[
+                httpx.Response(308, headers={"Range": "bytes=0-1"}),
+                httpx.Response(201, json={"id": "big_file"}),
+            ]
+        )
+
+        result = await api_client.upload_file({"name": "f"}, b"abcd", "text/plain")
+
+        assert result["id"] == "big_file"
+        resent = put_route.calls.last.request
+        assert resent.headers["Content-Range"] == "bytes 2-3/4"
+        assert resent.content == b"cd"
+
+    @respx.mock
+    async def test_upload_file_resumable_queries_offset_after_error(self, api_client):
+        """Test a failed upload request asks Drive what it committed before resending."""
+        api_client.RESUMABLE_THRESHOLD = 2
+        session_url = "https://www.googleapis.com/upload/drive/v3/files?upload_id=abc"
+
+        respx.post("https://www.googleapis.com/upload/drive/v3/files").mock(
+            return_value=httpx.Response(200, headers={"Location": session_url})
+        )
+        put_route = respx.put(session_url).mock(
+            side_effect=[
+                httpx.Response(503, json={"error": {"message": "Backend Error"}}),
+                httpx.Response(308, headers={"Range": "bytes=0-2"}),
+                httpx.Response(200, json={"id": "big_file"}),
+            ]
+        )
+
+        result = await api_client.upload_file({"name": "f"}, b"abcd", "text/plain")
+
+        assert result["id"] == "big_file"
+        query, resent = (call.request for call in put_route.calls[1:])
+        assert query.headers["Content-Range"] == "bytes */4"
+        assert query.content == b""
+        assert resent.headers["Content-Range"] == "bytes 3-3/4"
+        assert resent.content == b"d"
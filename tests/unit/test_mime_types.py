@@ -14,6 +14,7 @@ from google_drive_worker.normalization.mime_types import (
     GOOGLE_SITE,
     GOOGLE_SLIDE,
     GOOGLE_WORKSPACE_TYPES,
+    classify_mime,
     get_export_format,
     get_file_category,
     get_file_extension,
@@ -237,6 +238,21 @@ class TestMimeTypeUtilities:
         assert get_file_extension("unknown/type") is None
         assert get_file_extension(GOOGLE_FOLDER) is None  # Folders don't have extensions
 
+    @pytest.mark.parametrize(
+        "mime_type",
+        [GOOGLE_DOC, GOOGLE_FOLDER, GOOGLE_FORM, "application/pdf", "image/x-icon", "unknown/type"],
+    )
+    def test_classify_mime_matches_individual_lookups(self, mime_type):
+        """Test the fused classification agrees with the single-purpose helpers."""
+        assert classify_mime(mime_type) == (
+            is_folder(mime_type),
+            is_google_workspace_file(mime_type),
+            get_file_category(mime_type),
+            get_export_format(mime_type),
+            get_file_extension(mime_type),
+            needs_export(mime_type),
+        )
+
     def test_export_formats_consistency(self):
         """Test that export formats are properly defined."""
         # All export formats should be valid MIME types
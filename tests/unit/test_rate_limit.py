@@ -1,10 +1,12 @@
 """Unit tests for rate limiting utilities."""
 
 import asyncio
+import logging
 import pytest
 import time
 from unittest.mock import AsyncMock, patch, MagicMock
 
+from google_drive_worker.utils import rate_limit
 from google_drive_worker.utils.rate_limit import (
     ExponentialBackoff,
     RateLimitHandler,
@@ -14,7 +16,6 @@ from google_drive_worker.utils.rate_limit import (
 from google_drive_worker.utils.errors import RateLimitError
 
 
-@pytest.mark.asyncio
 class TestExponentialBackoff:
     """Test cases for ExponentialBackoff."""
 
@@ -45,9 +46,9 @@ class TestExponentialBackoff:
 
         # With jitter, delays should vary
         assert len(set(delays)) > 1
-        # But should be within expected range (±25%)
+        # But should be within expected range (full jitter: 0 to delay)
         for delay in delays:
-            assert 7.5 <= delay <= 12.5
+            assert 0 <= delay <= 10.0
 
     def test_backoff_reset(self):
         """Test resetting backoff counter."""
@@ -65,6 +66,7 @@ class TestExponentialBackoff:
         # Should start from beginning
         assert backoff.next_delay() == 1.0
 
+    @pytest.mark.asyncio
     async def test_backoff_wait(self):
         """Test async wait method."""
         backoff = ExponentialBackoff(base_delay=0.01, jitter=False)
@@ -91,11 +93,82 @@ class TestExponentialBackoff:
         # Internal state should still be at 0
         assert backoff._attempt == 0
 
+    def test_non_binary_multiplier(self):
+        """Test delays for a multiplier other than 2 are capped like doubling ones."""
+        backoff = ExponentialBackoff(base_delay=1.0, max_delay=10.0, multiplier=3.0, jitter=False)
+
+        assert [backoff.get_delay_for_attempt(a) for a in range(4)] == [1.0, 3.0, 9.0, 10.0]
+        assert backoff.get_delay_for_attempt(1000) == 10.0
+
+    def test_slow_growth_without_delay_table(self):
+        """Test delays are computed on demand when the table would be too long."""
+        backoff = ExponentialBackoff(base_delay=1.0, max_delay=60.0, multiplier=1.01, jitter=False)
+
+        assert backoff._delays == ()
+        assert backoff.get_delay_for_attempt(100) == pytest.approx(1.01 ** 100)
+        assert backoff.get_delay_for_attempt(1000) == 60.0
+
+    def test_seeded_rng_is_reproducible(self):
+        """Test seeding an instance's generator makes its jitter reproducible."""
+        first = ExponentialBackoff(base_delay=1.0, jitter=True)
+        second = ExponentialBackoff(base_delay=1.0, jitter=True)
+        first._rng.seed(42)
+        second._rng.seed(42)
+
+        assert [first.next_delay() for _ in range(5)] == [second.next_delay() for _ in range(5)]
+
+    def test_spread(self):
+        """Test spread randomizes a delay over 0.5x-1.5x."""
+        backoff = ExponentialBackoff()
+
+        delays = [backoff.spread(10.0) for _ in range(20)]
+
+        assert len(set(delays)) > 1
+        assert all(5.0 <= delay <= 15.0 for delay in delays)
+
+    def test_decorrelated_jitter(self):
+        """Test decorrelated jitter stays within [base, min(max, 3 * previous)]."""
+        backoff = ExponentialBackoff(base_delay=1.0, max_delay=20.0, jitter_mode="decorrelated")
+
+        previous = 1.0
+        for _ in range(20):
+            delay = backoff.next_delay()
+            assert 1.0 <= delay <= min(20.0, previous * 3)
+            previous = delay
+
+        backoff.reset()
+        assert backoff._prev_delay == 1.0
+
+    def test_unknown_jitter_mode(self):
+        """Test an unknown jitter mode is rejected."""
+        with pytest.raises(ValueError):
+            ExponentialBackoff(jitter_mode="symmetric")
+
+    @pytest.mark.asyncio
+    async def test_logging_enabled(self, caplog):
+        """Test backoff log calls format cleanly when DEBUG is enabled."""
+        backoff = ExponentialBackoff(base_delay=0.001, jitter=False)
+
+        with caplog.at_level(logging.DEBUG, logger="google_drive_worker.utils.rate_limit"):
+            await backoff.wait()
+
+        assert "Calculated backoff delay attempt=1 delay=0.00s" in caplog.text
+        assert "Backing off for 0.00 seconds attempt=1" in caplog.text
+
+    def test_full_jitter_at_cap(self):
+        """Test jitter still spreads delays once the exponential delay is capped."""
+        backoff = ExponentialBackoff(base_delay=1.0, max_delay=4.0, jitter=True)
+
+        delays = [backoff.get_delay_for_attempt(10) for _ in range(20)]
+
+        assert len(set(delays)) > 1
+        assert all(0 <= delay <= 4.0 for delay in delays)
+
 
-@pytest.mark.asyncio
 class TestRateLimitHandler:
     """Test cases for RateLimitHandler."""
 
+    @pytest.mark.asyncio
     async def test_handle_with_retry_after(self):
         """Test handling rate limit with Retry-After header."""
         handler = RateLimitHandler()
@@ -110,6 +183,51 @@ class TestRateLimitHandler:
         # Backoff should be reset after explicit retry_after
         assert handler.backoff._attempt == 0
 
+    @pytest.mark.asyncio
+    async def test_concurrent_retry_after_shares_wakeup(self):
+        """Test that tasks told to wait the same Retry-After share one timer."""
+        handlers = [RateLimitHandler() for _ in range(10)]
+
+        loop = asyncio.get_running_loop()
+        with patch.object(loop, "call_at", wraps=loop.call_at) as call_at:
+            tasks = [asyncio.create_task(h.handle_rate_limit(retry_after=0.05)) for h in handlers]
+            await asyncio.sleep(0)
+        assert call_at.call_count == 1
+        assert len(rate_limit._shared_wakeups) == 1
+
+        start = time.time()
+        await asyncio.gather(*tasks)
+        assert time.time() - start <= 0.1 + rate_limit.SHARED_WAKEUP_GRANULARITY
+        assert not rate_limit._shared_wakeups
+
+    @pytest.mark.asyncio
+    async def test_retry_after_shares_pending_deadline(self):
+        """Test a shorter Retry-After waits for a longer one already pending."""
+        handler = RateLimitHandler()
+
+        first = asyncio.create_task(handler.handle_rate_limit(retry_after=0.1))
+        await asyncio.sleep(0)
+
+        start = time.time()
+        await handler.handle_rate_limit(retry_after=0.01)
+        elapsed = time.time() - start
+        await first
+
+        assert 0.08 <= elapsed <= 0.1 + rate_limit.SHARED_WAKEUP_GRANULARITY
+
+    @pytest.mark.asyncio
+    async def test_handle_with_zero_retry_after(self):
+        """Test that Retry-After: 0 returns without sleeping."""
+        handler = RateLimitHandler()
+        handler.backoff._attempt = 3
+
+        with patch("google_drive_worker.utils.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            await handler.handle_rate_limit(retry_after=0)
+
+        sleep.assert_not_called()
+        assert handler.backoff._attempt == 0
+
+    @pytest.mark.asyncio
     async def test_handle_with_backoff(self):
         """Test handling rate limit with exponential backoff."""
         backoff = ExponentialBackoff(base_delay=0.01, jitter=False)
@@ -122,6 +240,7 @@ class TestRateLimitHandler:
         # Should use backoff delay
         assert 0.005 <= elapsed <= 0.05
 
+    @pytest.mark.asyncio
     async def test_handle_with_default_delay(self):
         """Test handling rate limit with default delay."""
         handler = RateLimitHandler(default_retry_after=0.05)
@@ -130,8 +249,21 @@ class TestRateLimitHandler:
         await handler.handle_rate_limit(retry_after=None, use_backoff=False)
         elapsed = time.time() - start
 
-        # Should use default delay
-        assert 0.04 <= elapsed <= 0.1
+        # Should use default delay, jittered by ±50%
+        assert 0.02 <= elapsed <= 0.1
+
+    @pytest.mark.asyncio
+    async def test_default_delay_is_jittered(self):
+        """Test the default wait is drawn around default_retry_after."""
+        handler = RateLimitHandler(default_retry_after=60)
+
+        with patch("google_drive_worker.utils.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(10):
+                await handler.handle_rate_limit(retry_after=None, use_backoff=False)
+
+        delays = [call.args[0] for call in sleep.call_args_list]
+        assert len(set(delays)) > 1
+        assert all(30 <= delay <= 90 for delay in delays)
 
     def test_handler_reset(self):
         """Test resetting rate limit handler."""
@@ -147,10 +279,10 @@ class TestRateLimitHandler:
         assert handler.backoff._attempt == 0
 
 
-@pytest.mark.asyncio
 class TestWithRateLimitRetry:
     """Test cases for with_rate_limit_retry decorator."""
 
+    @pytest.mark.asyncio
     async def test_successful_call(self):
         """Test decorator with successful function call."""
         call_count = 0
@@ -166,6 +298,7 @@ class TestWithRateLimitRetry:
         assert result == "success"
         assert call_count == 1
 
+    @pytest.mark.asyncio
     async def test_rate_limit_retry(self):
         """Test decorator retrying on rate limit error."""
         call_count = 0
@@ -183,6 +316,7 @@ class TestWithRateLimitRetry:
         assert result == "success"
         assert call_count == 3
 
+    @pytest.mark.asyncio
     async def test_rate_limit_exhausted(self):
         """Test decorator when max attempts exhausted."""
         call_count = 0
@@ -199,6 +333,7 @@ class TestWithRateLimitRetry:
         assert call_count == 2
         assert "Rate limited" in str(exc_info.value)
 
+    @pytest.mark.asyncio
     async def test_non_rate_limit_error(self):
         """Test decorator with non-rate-limit error."""
         call_count = 0
@@ -217,6 +352,67 @@ class TestWithRateLimitRetry:
         assert "Different error" in str(exc_info.value)
 
 
+    @pytest.mark.asyncio
+    async def test_nested_calls_share_backoff(self):
+        """Test nested decorated calls continue the outer call's backoff."""
+        backoff = ExponentialBackoff(base_delay=0.001, jitter=False)
+        inner_calls = 0
+
+        @with_rate_limit_retry(max_attempts=2)
+        async def inner():
+            nonlocal inner_calls
+            inner_calls += 1
+            if inner_calls < 3:
+                raise RateLimitError("Rate limited")
+            return "success"
+
+        @with_rate_limit_retry(max_attempts=2, backoff=backoff)
+        async def outer():
+            return await inner()
+
+        assert await outer() == "success"
+        # inner retried once and gave up, outer retried once: both backed off
+        # through the outer call's backoff
+        assert backoff._attempt == 2
+        assert rate_limit._shared_retry_state.get() is None
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self):
+        """Test decorator bounds calls in flight across invocations."""
+        in_flight = 0
+        peak = 0
+
+        @with_rate_limit_retry(max_attempts=3, max_concurrency=2)
+        async def test_func():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return "success"
+
+        results = await asyncio.gather(*(test_func() for _ in range(6)))
+
+        assert results == ["success"] * 6
+        assert peak == 2
+        assert test_func.__name__ == "test_func"
+
+    def test_max_concurrency_across_event_loops(self):
+        """Test a concurrency-capped function can be used from separate loops."""
+
+        @with_rate_limit_retry(max_attempts=3, max_concurrency=1)
+        async def test_func():
+            await asyncio.sleep(0.001)
+            return "success"
+
+        async def contend():
+            # Two calls so the second waits on (and binds) the semaphore
+            return await asyncio.gather(test_func(), test_func())
+
+        assert asyncio.run(contend()) == ["success", "success"]
+        assert asyncio.run(contend()) == ["success", "success"]
+
+
 class TestAdaptiveRateLimiter:
     """Test cases for AdaptiveRateLimiter."""
 
@@ -241,6 +437,17 @@ class TestAdaptiveRateLimiter:
         limiter.record_success()
         assert limiter.current_rate == 20.0  # Capped at max
 
+    def test_record_at_bounds_is_noop(self):
+        """Test that recording at a rate bound leaves the rate unchanged."""
+        limiter = AdaptiveRateLimiter(initial_rate=20.0, min_rate=1.0, max_rate=20.0)
+
+        limiter.record_success()
+        assert limiter.current_rate == 20.0
+
+        limiter.reset(1.0)
+        limiter.record_rate_limit()
+        assert limiter.current_rate == 1.0
+
     def test_record_rate_limit_decreases_rate(self):
         """Test that rate limit decreases rate."""
         limiter = AdaptiveRateLimiter(
@@ -263,15 +470,47 @@ class TestAdaptiveRateLimiter:
 
     @pytest.mark.asyncio
     async def test_acquire_delays(self):
-        """Test that acquire introduces appropriate delay."""
-        limiter = AdaptiveRateLimiter(initial_rate=100.0)  # 100 req/s = 0.01s delay
+        """Test that acquire waits once the burst allowance is spent."""
+        limiter = AdaptiveRateLimiter(initial_rate=20.0)  # 20 req/s = 0.05s spacing
 
+        # A full bucket (one second's worth) is available immediately
+        start = time.time()
+        for _ in range(20):
+            await limiter.acquire()
+        assert time.time() - start < 0.02
+
+        # The next request waits for a token to refill
         start = time.time()
         await limiter.acquire()
         elapsed = time.time() - start
 
-        # Should delay approximately 0.01 seconds
-        assert 0.005 <= elapsed <= 0.02
+        assert 0.04 <= elapsed <= 0.07
+
+    @pytest.mark.asyncio
+    async def test_acquire_refills_while_idle(self):
+        """Test that an idle caller is not throttled."""
+        limiter = AdaptiveRateLimiter(initial_rate=100.0)
+
+        for _ in range(100):
+            await limiter.acquire()
+        await asyncio.sleep(0.05)
+
+        # Five tokens refilled while idle
+        start = time.time()
+        for _ in range(5):
+            await limiter.acquire()
+        assert time.time() - start < 0.01
+
+    def test_acquire_across_event_loops(self):
+        """Test one limiter can be shared by separate event loops."""
+        limiter = AdaptiveRateLimiter(initial_rate=200.0)
+
+        async def contend():
+            # More acquirers than tokens, so some wait on (and bind) the lock
+            await asyncio.gather(*(limiter.acquire() for _ in range(202)))
+
+        asyncio.run(contend())
+        asyncio.run(contend())
 
     def test_reset_to_default(self):
         """Test resetting rate limiter."""
@@ -299,6 +538,11 @@ class TestAdaptiveRateLimiter:
         limiter.reset(0.5)
         assert limiter.current_rate == 1.0
 
+    def test_slotted_instances(self):
+        """Test the rate limiting classes don't carry a per-instance __dict__."""
+        for instance in (ExponentialBackoff(), RateLimitHandler(), AdaptiveRateLimiter()):
+            assert not hasattr(instance, "__dict__")
+
     def test_zero_rate_infinite_delay(self):
         """Test that zero rate returns infinite delay."""
         limiter = AdaptiveRateLimiter(initial_rate=0.0)
@@ -124,7 +124,15 @@ class TestGoogleDriveDataTransformer:
         assert result["source"]["transformation_version"] == "1.0.0"
         assert "transformed_at" in result["source"]
 
-        # Metadata
+        # Debug metadata is opt-in
+        assert "_metadata" not in result
+
+    def test_transform_file_debug_metadata(self, sample_google_doc):
+        """Test the _metadata debug summary is added when enabled."""
+        transformer = GoogleDriveDataTransformer(include_debug_metadata=True)
+
+        result = transformer.transform_file(sample_google_doc, connection_id="conn_123", customer_id="cust_456")
+
         assert result["_metadata"]["original_field_count"] == len(sample_google_doc)
 
     def test_transform_google_sheet(self, transformer, sample_google_sheet):
@@ -378,6 +386,52 @@ class TestGoogleDriveDataTransformer:
         assert results[1]["name"] == "Contract_Agreement.pdf"
         assert results[2]["name"] == "Project Documents"
 
+    def test_source_template_is_shared_read_only(self, transformer, mock_responses):
+        """Test records built from a source template copy it and add their IDs."""
+        template = transformer.source_template("conn", "cust", transformed_at="2025-01-01T00:00:00Z")
+
+        comment = transformer.transform_comment(
+            mock_responses["comment_sample"], "file1", "ignored", "ignored", source_template=template
+        )
+
+        assert comment["source"]["connection_id"] == "conn"
+        assert comment["source"]["transformed_at"] == "2025-01-01T00:00:00Z"
+        assert comment["source"]["file_id"] == "file1"
+        assert "file_id" not in template
+        with pytest.raises(TypeError):
+            template["provider"] = "other"
+
+    def test_transform_files_batch_shares_timestamp(self, transformer, mock_responses):
+        """Test batch transformation stamps every file with the same time."""
+        files = [mock_responses["google_doc"], mock_responses["pdf_file"]]
+
+        results = transformer.transform_files_batch(files, connection_id="conn_batch", customer_id="cust_batch")
+
+        assert results[0]["source"]["transformed_at"] == results[1]["source"]["transformed_at"]
+        assert results[0]["source"]["transformed_at"].endswith("Z")
+
+    def test_transform_file_uses_given_timestamp(self, transformer, sample_pdf):
+        """Test an explicit transformed_at is recorded as-is."""
+        result = transformer.transform_file(sample_pdf, "conn", "cust", transformed_at="2025-01-01T00:00:00Z")
+
+        assert result["source"]["transformed_at"] == "2025-01-01T00:00:00Z"
+
+    def test_iter_transform_files_is_lazy(self, transformer, mock_responses):
+        """Test files are transformed only as the iterator is consumed."""
+        consumed = []
+
+        def raw_files():
+            for raw_file in (mock_responses["google_doc"], mock_responses["pdf_file"]):
+                consumed.append(raw_file["id"])
+                yield raw_file
+
+        results = transformer.iter_transform_files(raw_files(), connection_id="conn", customer_id="cust")
+
+        assert consumed == []
+        assert next(results)["name"] == "Q4 Financial Report"
+        assert len(consumed) == 1
+        assert [r["name"] for r in results] == ["Contract_Agreement.pdf"]
+
     def test_transform_files_batch_with_error(self, transformer, mock_responses, caplog):
         """Test batch transformation handles invalid data gracefully."""
         files = [
@@ -401,6 +455,16 @@ class TestGoogleDriveDataTransformer:
         assert invalid_result["mime_type"] == "application/octet-stream"
         assert invalid_result["category"] == "other"
 
+    def test_transform_files_batch_counts_failures(self, transformer, mock_responses, caplog):
+        """Test files that fail to transform are logged, counted and skipped."""
+        files = [mock_responses["pdf_file"], {"id": "bad", "mimeType": None}]
+
+        results = transformer.transform_files_batch(files, connection_id="conn", customer_id="cust")
+
+        assert len(results) == 1
+        assert transformer.transform_failures == 1
+        assert "Failed to transform file bad" in caplog.text
+
     def test_parse_timestamp_with_utc(self, transformer):
         """Test timestamp parsing with UTC indicator."""
         # Already has Z suffix
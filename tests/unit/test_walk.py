@@ -0,0 +1,122 @@
+"""Unit tests for concurrent folder-tree traversal."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from google_drive_worker.normalization.mime_types import GOOGLE_FOLDER
+from google_drive_worker.utils.walk import PARENTS_PER_QUERY, walk_folders
+
+
+def _folder(folder_id, parent_id):
+    return {"id": folder_id, "name": folder_id, "mimeType": GOOGLE_FOLDER, "parents": [parent_id]}
+
+
+def _file(file_id, parent_id):
+    return {"id": file_id, "name": file_id, "mimeType": "text/plain", "parents": [parent_id]}
+
+
+def _make_client(tree):
+    """Build a mock API client answering or-joined 'in parents' queries from tree."""
+
+    async def list_files(page_size=100, page_token=None, query=None, fields=None, **kwargs):
+        folders_only = "mimeType" in query
+        files = []
+        for parent_id, children in tree.items():
+            if f"'{parent_id}' in parents" in query:
+                files.extend(
+                    c for c in children if not folders_only or c["mimeType"] == GOOGLE_FOLDER
+                )
+        return {"files": files}
+
+    client = AsyncMock()
+    client.list_files = AsyncMock(side_effect=list_files)
+    return client
+
+
+class TestWalkFolders:
+    """Test walk_folders traversal."""
+
+    @pytest.mark.asyncio
+    async def test_walks_tree_in_level_order(self):
+        """Each item appears after the folder containing it."""
+        tree = {
+            "root": [_folder("a", "root"), _file("f1", "root")],
+            "a": [_folder("b", "a"), _file("f2", "a")],
+            "b": [_file("f3", "b")],
+        }
+        client = _make_client(tree)
+
+        items = await walk_folders(client, "root", folders_only=False)
+
+        ids = [item["id"] for item in items]
+        assert set(ids) == {"a", "f1", "b", "f2", "f3"}
+        assert ids.index("a") < ids.index("b") < ids.index("f3")
+        # One call per tree level
+        assert client.list_files.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_folders_only(self):
+        """Regular files are skipped when folders_only is set."""
+        tree = {
+            "root": [_folder("a", "root"), _file("f1", "root")],
+            "a": [_file("f2", "a")],
+        }
+        client = _make_client(tree)
+
+        items = await walk_folders(client, "root")
+
+        assert [item["id"] for item in items] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_groups_parents_into_chunked_queries(self):
+        """Sibling folders are listed PARENTS_PER_QUERY at a time."""
+        folder_count = PARENTS_PER_QUERY + 10
+        tree = {"root": [_folder(f"d{i}", "root") for i in range(folder_count)]}
+        client = _make_client(tree)
+
+        items = await walk_folders(client, "root")
+
+        assert len(items) == folder_count
+        # 1 call for root + 2 chunked calls for the second level
+        assert client.list_files.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_follows_pagination(self):
+        """All pages of a children listing are consumed."""
+        client = AsyncMock()
+        client.list_files = AsyncMock(
+            side_effect=[
+                {"files": [_file("f1", "root")], "nextPageToken": "page2"},
+                {"files": [_file("f2", "root")]},
+            ]
+        )
+
+        items = await walk_folders(client, "root", folders_only=False)
+
+        assert [item["id"] for item in items] == ["f1", "f2"]
+        assert client.list_files.call_args_list[1].kwargs["page_token"] == "page2"
+
+    @pytest.mark.asyncio
+    async def test_fanout_bounds_concurrency(self):
+        """No more than fanout listings are in flight at once."""
+        in_flight = 0
+        peak = 0
+
+        async def list_files(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            if "'root' in parents" in kwargs["query"]:
+                return {"files": [_folder(f"d{i}", "root") for i in range(PARENTS_PER_QUERY * 4)]}
+            return {"files": []}
+
+        client = AsyncMock()
+        client.list_files = AsyncMock(side_effect=list_files)
+
+        await walk_folders(client, "root", fanout=2)
+
+        assert peak == 2
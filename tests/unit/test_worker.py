@@ -0,0 +1,442 @@
+"""Unit tests for worker message processing."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from tenacity import wait_none
+
+from google_drive_worker import worker as worker_module
+from google_drive_worker.worker import GoogleDriveWorker
+from google_drive_worker.config import Settings, WorkerConfig
+from google_drive_worker.utils.errors import RateLimitError, RetriableError
+
+
+@pytest.fixture
+def settings():
+    """Create test settings."""
+    return Settings()
+
+
+@pytest.fixture
+def worker(settings):
+    """Create a worker instance with mocked dependencies."""
+    with patch("google_drive_worker.worker.KafkaConsumer"), \
+         patch("google_drive_worker.worker.KafkaProducer"):
+        worker = GoogleDriveWorker(settings)
+        worker.producer = AsyncMock()
+        worker.consumer = AsyncMock()
+        return worker
+
+
+@pytest.fixture
+def no_retry_wait():
+    """Retry _process_with_retry immediately."""
+    with patch.object(GoogleDriveWorker._process_with_retry.retry, "wait", wait_none()):
+        yield
+
+
+def make_record(index):
+    """Build a JSON-RPC record with a unique nonce."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "ingest.record",
+        "params": {"nonce": f"nonce_{index}", "data": {"index": index}},
+    }
+
+
+def make_message(connection_id, index):
+    """Build a polled Kafka message for a connection."""
+    value = {
+        "jsonrpc": "2.0",
+        "method": "integration.fetch",
+        "params": {
+            "header": {"parameters": {"integration_connection_id": connection_id}},
+            "index": index,
+        },
+    }
+    return SimpleNamespace(topic="commands", key=connection_id, value=value, headers={})
+
+
+class RecordHandler:
+    """Handler stub yielding a fixed list of records."""
+
+    def __init__(self, records):
+        self.records = records
+
+    async def process_message(self, message, connection_config):
+        for record in self.records:
+            yield record
+
+
+class TestProcessWithRetry:
+    """Test record production in _process_with_retry."""
+
+    @pytest.mark.asyncio
+    async def test_retry_resends_records_after_failed_send(self, worker, no_retry_wait):
+        """A send failing partway is retried along with every unsent record after it."""
+        records = [make_record(i) for i in range(8)]
+        delivered = []
+        failed = False
+
+        async def send(topic, key, value, headers):
+            nonlocal failed
+            await asyncio.sleep(0)
+            if headers["nonce"] == "nonce_3" and not failed:
+                failed = True
+                raise RetriableError("broker unavailable")
+            await asyncio.sleep(0)
+            delivered.append(headers["nonce"])
+
+        worker.producer.send.side_effect = send
+
+        with patch.object(worker_module, "MAX_IN_FLIGHT_SENDS", 2):
+            await worker._process_with_retry(RecordHandler(records), {}, "conn_123", {})
+
+        assert failed
+        assert sorted(delivered) == sorted(r["params"]["nonce"] for r in records)
+        assert len(delivered) == len(set(delivered))
+
+    @pytest.mark.asyncio
+    async def test_duplicate_nonce_sent_once(self, worker):
+        """Records repeating a delivered nonce are skipped."""
+        records = [make_record(0), make_record(1), make_record(0)]
+
+        count = await worker._process_with_retry(RecordHandler(records), {}, "conn_123", {})
+
+        assert count == 3
+        assert worker.producer.send.await_count == 2
+        assert worker.metrics["duplicates_skipped"] == 1
+
+
+class TestProcessBatch:
+    """Test concurrent batch processing across connections."""
+
+    @pytest.mark.asyncio
+    async def test_groups_by_connection_in_poll_order(self, worker):
+        """Each connection's messages are processed in poll order."""
+        processed = []
+
+        async def process_single_message(message, connection_id, integration_id):
+            await asyncio.sleep(0)
+            processed.append((connection_id, message.value["params"]["index"]))
+
+        worker._process_single_message = process_single_message
+        messages = [
+            make_message("conn_a", 0),
+            make_message("conn_b", 1),
+            make_message("conn_a", 2),
+            make_message("conn_b", 3),
+            make_message("conn_a", 4),
+        ]
+
+        await worker._process_batch(messages)
+
+        assert [i for c, i in processed if c == "conn_a"] == [0, 2, 4]
+        assert [i for c, i in processed if c == "conn_b"] == [1, 3]
+
+    @pytest.mark.asyncio
+    async def test_connections_run_concurrently(self, worker):
+        """A slow connection does not hold up the others."""
+        b_done = asyncio.Event()
+
+        async def process_single_message(message, connection_id, integration_id):
+            if connection_id == "conn_a":
+                await asyncio.wait_for(b_done.wait(), timeout=1)
+            else:
+                b_done.set()
+
+        worker._process_single_message = process_single_message
+
+        await worker._process_batch([make_message("conn_a", 0), make_message("conn_b", 1)])
+
+        assert b_done.is_set()
+
+    @pytest.mark.asyncio
+    async def test_group_error_does_not_affect_other_groups(self, worker):
+        """An error stops the failing connection's group only and is logged."""
+        processed = []
+
+        async def process_single_message(message, connection_id, integration_id):
+            if connection_id == "conn_a":
+                raise RuntimeError("boom")
+            processed.append(message.value["params"]["index"])
+
+        worker._process_single_message = process_single_message
+        worker.logger = Mock()
+        messages = [
+            make_message("conn_a", 0),
+            make_message("conn_b", 1),
+            make_message("conn_a", 2),
+            make_message("conn_b", 3),
+        ]
+
+        await worker._process_batch(messages)
+
+        assert processed == [1, 3]
+        worker.logger.error.assert_called_once()
+        assert worker.logger.error.call_args.kwargs["connection_id"] == "conn_a"
+
+
+class TestConsumerBatchSize:
+    """Test the Kafka poll batch size setting."""
+
+    def test_default_batch_size(self):
+        """Test the documented default is used."""
+        assert WorkerConfig().consumer_batch_size == 100
+
+    def test_batch_size_from_env(self, monkeypatch):
+        """Test WORKER_CONSUMER_BATCH_SIZE overrides the default."""
+        monkeypatch.setenv("WORKER_CONSUMER_BATCH_SIZE", "20")
+
+        assert WorkerConfig().consumer_batch_size == 20
+
+    @pytest.mark.asyncio
+    async def test_poll_uses_configured_batch_size(self, worker):
+        """Test each poll asks for the configured batch size and timeout."""
+        worker.settings.worker.consumer_batch_size = 5
+        worker.settings.worker.consumer_poll_timeout_ms = 250
+
+        async def poll_messages(max_messages, timeout_ms):
+            worker.running = False
+            return []
+
+        worker.consumer.poll_messages.side_effect = poll_messages
+        worker.running = True
+
+        await worker._process_messages()
+
+        worker.consumer.poll_messages.assert_awaited_once_with(max_messages=5, timeout_ms=250)
+
+
+class TestRouting:
+    """Test method/action route tables."""
+
+    def test_routes_match_handler_scan(self, worker):
+        """Each method and action routes to the first handler supporting it."""
+        for handler in worker.handlers:
+            for method in handler.SUPPORTED_METHODS:
+                first = next(h for h in worker.handlers if method in h.SUPPORTED_METHODS)
+                assert worker._method_routes[method] is first
+            for action in handler.SUPPORTED_ACTIONS:
+                first = next(h for h in worker.handlers if action in h.SUPPORTED_ACTIONS)
+                assert worker._action_routes[action] is first
+
+    def test_fetch_routes(self, worker):
+        """Fetch method and legacy action route to the fetch handler."""
+        fetch_handler = worker._method_routes["clustera.integration.content.fetch"]
+
+        assert type(fetch_handler).__name__ == "FetchHandler"
+        assert worker._action_routes["fetch"] is fetch_handler
+
+    @pytest.mark.asyncio
+    async def test_unknown_method_not_routed(self, worker):
+        """A method no handler supports is skipped and marked for commit."""
+        worker._get_connection_config = AsyncMock()
+        value = {"jsonrpc": "2.0", "method": "clustera.integration.unknown", "params": {}}
+
+        await worker._handle_message("commands", "conn_123", value, {}, "conn_123")
+
+        worker._get_connection_config.assert_not_awaited()
+        assert worker._commit_pending
+
+    @pytest.mark.asyncio
+    async def test_other_provider_not_routed(self, worker):
+        """The routed handler's can_handle still rejects other providers."""
+        worker._get_connection_config = AsyncMock()
+        value = {
+            "jsonrpc": "2.0",
+            "method": "clustera.integration.content.fetch",
+            "params": {"header": {"parameters": {"integration_provider_name": "dropbox"}}},
+        }
+
+        await worker._handle_message("commands", "conn_123", value, {}, "conn_123")
+
+        worker._get_connection_config.assert_not_awaited()
+        assert worker._commit_pending
+
+
+class TestConnectionConfigCache:
+    """Test caching of Control Plane connection configs."""
+
+    @pytest.mark.asyncio
+    async def test_cached_after_first_fetch(self, worker):
+        """A second lookup for the same connection is served from the cache."""
+        handler = Mock()
+        handler.fetch_connection_config = AsyncMock(return_value={"access_token": "token"})
+
+        first = await worker._get_connection_config(handler, "conn_123")
+        second = await worker._get_connection_config(handler, "conn_123")
+
+        assert first == second == {"access_token": "token"}
+        handler.fetch_connection_config.assert_awaited_once_with("conn_123")
+
+    @pytest.mark.asyncio
+    async def test_returns_copies(self, worker):
+        """Callers modifying the returned config do not change the cached one."""
+        handler = Mock()
+        handler.fetch_connection_config = AsyncMock(return_value={"access_token": "token"})
+
+        config = await worker._get_connection_config(handler, "conn_123")
+        config["snowball_id"] = "snowball_1"
+
+        assert await worker._get_connection_config(handler, "conn_123") == {"access_token": "token"}
+
+    @pytest.mark.asyncio
+    async def test_refresh_refetches(self, worker):
+        """refresh=True bypasses the cache and stores the new config."""
+        handler = Mock()
+        handler.fetch_connection_config = AsyncMock(
+            side_effect=[{"access_token": "old"}, {"access_token": "new"}]
+        )
+
+        await worker._get_connection_config(handler, "conn_123")
+        refreshed = await worker._get_connection_config(handler, "conn_123", refresh=True)
+
+        assert refreshed == {"access_token": "new"}
+        assert await worker._get_connection_config(handler, "conn_123") == {"access_token": "new"}
+        assert handler.fetch_connection_config.await_count == 2
+
+
+def make_retry_state(error, attempt_number=1):
+    """Build the retry state tenacity passes to a wait strategy."""
+    return Mock(attempt_number=attempt_number, outcome=Mock(exception=Mock(return_value=error)))
+
+
+class TestRetryWait:
+    """Test the wait between _process_with_retry attempts."""
+
+    def test_honors_retry_after(self):
+        """A rate limit's retry_after is used as the wait."""
+        state = make_retry_state(RateLimitError(retry_after=7))
+
+        assert worker_module._retry_wait(state) == 7.0
+
+    def test_caps_retry_after(self):
+        """A long retry_after is capped at MAX_RETRY_WAIT_SECONDS."""
+        state = make_retry_state(RateLimitError(retry_after=3600))
+
+        assert worker_module._retry_wait(state) == worker_module.MAX_RETRY_WAIT_SECONDS
+
+    def test_jittered_backoff_without_retry_after(self):
+        """Other errors wait a random time within the exponential bound."""
+        waits = {
+            worker_module._retry_wait(make_retry_state(RetriableError("flaky"), attempt_number=2))
+            for _ in range(20)
+        }
+
+        assert all(0 <= wait <= 2.0 * 2**2 for wait in waits)
+        assert len(waits) > 1
+
+
+class TestProducedAt:
+    """Test the cached produced_at header."""
+
+    def test_format(self, worker):
+        """Header is a naive UTC ISO-8601 timestamp with milliseconds."""
+        with patch("google_drive_worker.worker.time.time", return_value=1735689600.123456):
+            assert worker._produced_at() == "2025-01-01T00:00:00.123"
+
+    def test_reused_within_millisecond(self, worker):
+        """Calls in the same millisecond share one string; a new one reformats."""
+        with patch("google_drive_worker.worker.time.time") as mock_time:
+            mock_time.return_value = 1735689600.1231
+            first = worker._produced_at()
+            mock_time.return_value = 1735689600.1239
+            second = worker._produced_at()
+            mock_time.return_value = 1735689600.1241
+            third = worker._produced_at()
+
+        assert second is first
+        assert third == "2025-01-01T00:00:00.124"
+
+
+class TestStop:
+    """Test graceful shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_waits_for_active_connection(self, worker):
+        """stop() returns once the in-flight message finishes."""
+        release = asyncio.Event()
+        finished = []
+
+        async def handle_message(*args):
+            await release.wait()
+            finished.append(True)
+
+        worker._handle_message = handle_message
+        processing = asyncio.create_task(
+            worker._process_single_message(make_message("conn_a", 0), "conn_a", None)
+        )
+        await asyncio.sleep(0)
+        assert worker.active_connections == {"conn_a"}
+
+        stopping = asyncio.create_task(worker.stop())
+        await asyncio.sleep(0)
+        assert not stopping.done()
+
+        release.set()
+        await asyncio.wait_for(stopping, timeout=1)
+
+        assert finished == [True]
+        worker.consumer.stop.assert_awaited_once()
+        await processing
+
+    @pytest.mark.asyncio
+    async def test_grace_period_elapses(self, worker):
+        """stop() gives up on connections still active after the grace period."""
+        worker.settings.worker.shutdown_grace_seconds = 0.01
+        worker.logger = Mock()
+        worker.active_connections.add("conn_a")
+        worker.connections_idle.clear()
+
+        await asyncio.wait_for(worker.stop(), timeout=1)
+
+        worker.logger.warning.assert_any_call(
+            "Shutdown grace period elapsed with active connections", count=1
+        )
+        worker.consumer.stop.assert_awaited_once()
+
+
+class TestPartitionRevoke:
+    """Test offset commits when partitions are revoked."""
+
+    @pytest.mark.asyncio
+    async def test_consumer_gets_revoke_listener(self, worker):
+        """The consumer is created with the revoke callback."""
+        with patch("google_drive_worker.worker.KafkaConsumer") as consumer_cls, \
+             patch("google_drive_worker.worker.KafkaProducer"):
+            await worker._init_kafka_clients()
+
+        assert consumer_cls.call_args.kwargs["on_revoke"] == worker._on_partitions_revoked
+
+    def test_commits_pending_offsets(self, worker):
+        """Pending offsets are committed synchronously on revoke."""
+        consumer = Mock()
+        worker._commit_pending = True
+
+        worker._on_partitions_revoked(consumer, ["commands-0"])
+
+        consumer.commit.assert_called_once_with(asynchronous=False)
+        assert not worker._commit_pending
+
+    def test_nothing_pending(self, worker):
+        """No commit is made when nothing was processed since the last one."""
+        consumer = Mock()
+
+        worker._on_partitions_revoked(consumer, ["commands-0"])
+
+        consumer.commit.assert_not_called()
+
+    def test_commit_failure_keeps_pending(self, worker):
+        """A failed revoke commit is logged and left pending."""
+        consumer = Mock()
+        consumer.commit.side_effect = RuntimeError("coordinator unavailable")
+        worker._commit_pending = True
+        worker.logger = Mock()
+
+        worker._on_partitions_revoked(consumer, ["commands-0"])
+
+        assert worker._commit_pending
+        worker.logger.warning.assert_called_once()
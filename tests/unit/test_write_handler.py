@@ -0,0 +1,158 @@
+"""Unit tests for Google Drive write handler."""
+
+import base64
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from google_drive_worker.handlers.write import WriteHandler
+from google_drive_worker.config import GoogleDriveAPIConfig
+from google_drive_worker.normalization.mime_types import GOOGLE_FOLDER
+from google_drive_worker.utils.errors import ValidationError
+
+
+@pytest.fixture
+def api_config():
+    """Create test API configuration."""
+    return GoogleDriveAPIConfig()
+
+
+@pytest.fixture
+def handler(api_config):
+    """Create write handler instance."""
+    return WriteHandler(api_config)
+
+
+@pytest.fixture
+def mock_api_client():
+    """Create mock API client built by the handler."""
+    client = AsyncMock()
+    client.close = AsyncMock()
+    with patch(
+        "google_drive_worker.handlers.write.GoogleDriveAPIClient", return_value=client
+    ) as client_cls:
+        client.client_cls = client_cls
+        yield client
+
+
+@pytest.fixture
+def connection_config():
+    """Create test connection configuration."""
+    return {
+        "access_token": "test_access_token",
+        "refresh_token": "test_refresh_token",
+    }
+
+
+def make_message(operation, payload):
+    """Build a JSON-RPC write message."""
+    return {
+        "jsonrpc": "2.0",
+        "method": "clustera.integration.content.dispatch",
+        "params": {
+            "header": {"parameters": {"integration_connection_id": "conn_abc123"}},
+            "operation": operation,
+            "payload": payload,
+        },
+    }
+
+
+async def run(handler, message, connection_config):
+    """Run process_message to completion."""
+    return [record async for record in handler.process_message(message, connection_config)]
+
+
+class TestWriteRouting:
+    """Test routing of write operations."""
+
+    @pytest.mark.asyncio
+    async def test_upload_file(self, handler, mock_api_client, connection_config):
+        """upload_file decodes the content and uploads it."""
+        mock_api_client.upload_file.return_value = {"id": "new_file"}
+        message = make_message("upload_file", {
+            "name": "notes.txt",
+            "mime_type": "text/plain",
+            "parent_id": "folder_1",
+            "content": base64.b64encode(b"hello").decode(),
+        })
+
+        records = await run(handler, message, connection_config)
+
+        assert records == []
+        mock_api_client.upload_file.assert_awaited_once_with(
+            {"name": "notes.txt", "mimeType": "text/plain", "parents": ["folder_1"]},
+            b"hello",
+            "text/plain",
+        )
+        mock_api_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_upload_file_invalid_base64(self, handler, mock_api_client, connection_config):
+        """Invalid base64 content is rejected and the client is still closed."""
+        message = make_message("upload_file", {"name": "notes.txt", "content": "not base64!"})
+
+        with pytest.raises(ValidationError):
+            await run(handler, message, connection_config)
+
+        mock_api_client.upload_file.assert_not_awaited()
+        mock_api_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_copy_file(self, handler, mock_api_client, connection_config):
+        """copy_file copies a regular file to the destination."""
+        mock_api_client.get_file.return_value = {
+            "id": "file_1", "name": "a.txt", "mimeType": "text/plain", "parents": ["root"],
+        }
+        mock_api_client.copy_file.return_value = {"id": "copy_1"}
+        message = make_message("copy_file", {
+            "file_id": "file_1", "destination_folder_id": "folder_2", "name": "b.txt",
+        })
+
+        await run(handler, message, connection_config)
+
+        mock_api_client.copy_file.assert_awaited_once_with(
+            "file_1", name="b.txt", parent_id="folder_2"
+        )
+        mock_api_client.create_folder.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_copy_folder_into_itself(self, handler, mock_api_client, connection_config):
+        """Copying a folder into its own subtree is rejected before creating anything."""
+        mock_api_client.get_file.return_value = {
+            "id": "folder_1", "name": "A", "mimeType": GOOGLE_FOLDER, "parents": ["root"],
+        }
+        message = make_message("copy_file", {
+            "file_id": "folder_1", "destination_folder_id": "folder_1",
+        })
+
+        with patch("google_drive_worker.handlers.write.walk_folders", AsyncMock(return_value=[])):
+            with pytest.raises(ValidationError):
+                await run(handler, message, connection_config)
+
+        mock_api_client.create_folder.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_move_file(self, handler, mock_api_client, connection_config):
+        """move_file swaps the file's current parents for the destination."""
+        mock_api_client.get_file.return_value = {
+            "id": "file_1", "name": "a.txt", "mimeType": "text/plain", "parents": ["root"],
+        }
+        message = make_message("move_file", {
+            "file_id": "file_1", "destination_folder_id": "folder_2",
+        })
+
+        await run(handler, message, connection_config)
+
+        mock_api_client.update_file_metadata.assert_awaited_once_with(
+            "file_1", add_parents=["folder_2"], remove_parents=["root"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_unimplemented_operation(self, handler, mock_api_client, connection_config):
+        """Operations without an implementation build no API client."""
+        message = make_message("delete_file", {"file_id": "file_1"})
+
+        records = await run(handler, message, connection_config)
+
+        assert records == []
+        mock_api_client.client_cls.assert_not_called()